@@ -1,10 +1,7 @@
 import logging
 
 from src.api.jira_api_client import JiraApiClient
-from src.utils.logging_config import configure_logging
 
-# Configure logging for the factory module
-configure_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -17,6 +14,18 @@ class JiraApiFactory:
         if client_type == "generic":
             logger.info("Creating a generic Jira API client.")
             return JiraApiClient()
+        elif client_type == "http2":
+            try:
+                from src.api.jira_http2_client import JiraHttp2Client
+
+                logger.info("Creating an HTTP/2 Jira API client.")
+                return JiraHttp2Client()
+            except ImportError:
+                logger.warning(
+                    "httpx with HTTP/2 support is not installed; "
+                    "falling back to the generic client."
+                )
+                return JiraApiClient()
         else:
             logger.error(f"Unknown client type requested: {client_type}")
             raise ValueError(f"Unknown client type: {client_type}")
@@ -1,74 +1,377 @@
 # Configure the logging for the module
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 
-from config import API_TOKEN, EMAIL, JIRA_URL
+try:
+    import ijson
+except ImportError:  # ijson is optional; stream_get falls back to get()
+    ijson = None
+
+from config import get_settings
+from src.utils import fast_json
 from src.utils.error_handler import handle_request_exception
-from src.utils.logging_config import configure_logging
 
-configure_logging()
 logger = logging.getLogger(__name__)
 
 
 class JiraApiClient:
     """Generic JIRA API Client to handle basic API operations."""
 
-    def __init__(self, base_url=f"{JIRA_URL}/rest/api/3/"):
-        """Initialize the Jira API client."""
-        self.base_url = base_url
-        self.auth = HTTPBasicAuth(EMAIL, API_TOKEN)
+    def __init__(self, base_url=None):
+        """Initialize the Jira API client with a pooled, keep-alive session."""
+        settings = get_settings()
+        self.base_url = base_url or f"{settings.JIRA_URL}/rest/api/3/"
         self.headers = {
             "Accept": "application/json",
+            "Accept-Encoding": "gzip",
             "Content-Type": "application/json",
             "Connection": "keep-alive",
         }
 
-    def get(self, endpoint, params=None):
-        """Make a GET request to the Jira API."""
+        # Reuse a single session so TCP+TLS connections are kept alive across
+        # the many small REST calls the CLI issues, instead of paying a new
+        # handshake on every request.
+        self.session = requests.Session()
+        self.session.auth = HTTPBasicAuth(settings.EMAIL, settings.API_TOKEN)
+        self.session.headers.update(self.headers)
+
+        # Retries happen inside urllib3 with exponential backoff and honor
+        # the server's Retry-After hint on 429/503, so rate-limited calls
+        # sleep exactly as long as Jira asks instead of failing outright.
+        retry_strategy = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST", "PUT"}),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=10, pool_maxsize=20, max_retries=retry_strategy
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # In-memory TTL caches for GET responses: metadata and project
+        # lookups repeat with identical parameters within a single CLI run,
+        # so repeat reads skip the HTTP round-trip entirely. Rarely-changing
+        # metadata endpoints get a much longer TTL than issue lists.
+        self._response_cache = TTLCache(maxsize=256, ttl=300)
+        self._meta_cache = TTLCache(maxsize=128, ttl=86400)
+
+        # ETag bookkeeping per cache key: when a TTL entry lapses, the stale
+        # body is served immediately and revalidated in the background with
+        # If-None-Match — a 304 renews the entry without a body reparse.
+        # Bounded like the response caches, since each entry retains a full
+        # parsed body; a day-old stale body is not worth revalidating anyway.
+        self._etag_cache = TTLCache(maxsize=256, ttl=86400)
+        self._revalidating = set()
+
+        # cachetools caches are not thread-safe, and they are touched from
+        # the *_many/prefetch thread pools and the background revalidation
+        # thread; one lock guards every read and write of the three stores.
+        self._cache_lock = threading.Lock()
+
+        # Joined-URL cache: bulk loops hit the same few endpoints thousands
+        # of times, so skip re-concatenating the base URL on every call.
+        self._url_cache = {}
+
+    def _url(self, endpoint):
+        """Return the full URL for an endpoint, memoized per instance."""
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self.base_url + endpoint
+            self._url_cache[endpoint] = url
+        return url
+
+    def _cache_for(self, endpoint):
+        """Pick the TTL cache tier for an endpoint."""
+        if endpoint.startswith(("issue/createmeta", "project/")):
+            return self._meta_cache
+        return self._response_cache
+
+    def get(self, endpoint, params=None, cache=True):
+        """
+        Make a GET request to the Jira API.
+
+        Cached responses are served from a TTL cache; once an entry lapses
+        but an ETag is known, the stale body is returned immediately and a
+        background conditional GET revalidates it (stale-while-revalidate),
+        so metadata rechecks never block the caller.
+
+        :param endpoint: API endpoint relative to the base URL.
+        :param params: Optional query parameters.
+        :param cache: Whether to serve/store the response in the TTL cache.
+        """
+        cache_key = (endpoint, tuple(sorted((params or {}).items())))
+        if cache:
+            store = self._cache_for(endpoint)
+            with self._cache_lock:
+                cached = store.get(cache_key)
+                stale = (
+                    self._etag_cache.get(cache_key) if cached is None else None
+                )
+                spawn_revalidate = (
+                    stale is not None and cache_key not in self._revalidating
+                )
+                if spawn_revalidate:
+                    self._revalidating.add(cache_key)
+
+            if cached is not None:
+                logger.info(
+                    f"Serving GET {endpoint} from the in-memory response cache."
+                )
+                return cached
+
+            if stale is not None:
+                if spawn_revalidate:
+                    threading.Thread(
+                        target=self._revalidate,
+                        args=(endpoint, params, cache_key),
+                        daemon=True,
+                    ).start()
+                logger.info(f"Serving stale GET {endpoint} while revalidating.")
+                return stale[1]
+
+            return self._fetch(endpoint, params, cache_key, store)
+
+        return self._fetch(endpoint, params, cache_key, None)
+
+    def _fetch(self, endpoint, params, cache_key, store):
+        """Perform the GET, using If-None-Match when an ETag is known."""
+        headers = None
+        with self._cache_lock:
+            etag_entry = self._etag_cache.get(cache_key)
+        if etag_entry is not None:
+            headers = {"If-None-Match": etag_entry[0]}
+
         try:
-            response = requests.get(
-                f"{self.base_url}{endpoint}",
-                headers=self.headers,
+            response = self.session.get(
+                self._url(endpoint),
                 params=params,
-                auth=self.auth,
+                headers=headers,
             )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            if response.status_code == 304 and etag_entry is not None:
+                # Not modified: renew the cached body without reparsing
+                result = etag_entry[1]
+                etag = None
+            else:
+                response.raise_for_status()
+                result = (
+                    fast_json.loads(response.content) if response.content else None
+                )
+                etag = response.headers.get("ETag")
+            with self._cache_lock:
+                # Only track ETags for cacheable requests; uncached calls
+                # (every search page of every query) would otherwise pile
+                # their bodies up here for the life of the process
+                if etag and result is not None and store is not None:
+                    self._etag_cache[cache_key] = (etag, result)
+                if store is not None and result is not None:
+                    store[cache_key] = result
+            return result
+        except (requests.exceptions.RequestException, ValueError) as e:
             handle_request_exception(e, f"Error during GET request to {endpoint}")
             return None
 
+    def _revalidate(self, endpoint, params, cache_key):
+        """Refresh a stale cached response in the background."""
+        try:
+            self._fetch(endpoint, params, cache_key, self._cache_for(endpoint))
+        finally:
+            with self._cache_lock:
+                self._revalidating.discard(cache_key)
+
+    def invalidate(self, endpoint_prefix):
+        """Drop cached GET responses whose endpoint starts with the prefix."""
+        with self._cache_lock:
+            for store in (self._response_cache, self._meta_cache, self._etag_cache):
+                stale_keys = [
+                    key for key in store if key[0].startswith(endpoint_prefix)
+                ]
+                for key in stale_keys:
+                    del store[key]
+
     def post(self, endpoint, payload):
         """Make a POST request to the Jira API."""
         try:
-            self.headers.update({"Accept": "*/*"})
-            self.headers.pop("Accept-Encoding", "gzip, deflate, br")
-
-            response = requests.post(
-                f"{self.base_url}{endpoint}",
-                json=payload,
-                headers=self.headers,
-                auth=self.auth,
+            response = self.session.post(
+                self._url(endpoint),
+                data=fast_json.dumps(payload),
+                headers={"Accept": "*/*"},
             )
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            self.invalidate(endpoint)
+            # Creation endpoints answer 204/empty on some success paths;
+            # parsing an empty body would raise instead of succeeding
+            if not response.content:
+                return None
+            return fast_json.loads(response.content)
+        except (requests.exceptions.RequestException, ValueError) as e:
             handle_request_exception(e, f"Error during POST request to {endpoint}")
             return None
 
     def put(self, endpoint, payload):
         """Make a PUT request to the Jira API."""
         try:
-            response = requests.put(
-                f"{self.base_url}{endpoint}",
-                json=payload,
-                headers=self.headers,
-                auth=self.auth,
+            response = self.session.put(
+                self._url(endpoint),
+                data=fast_json.dumps(payload),
             )
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            self.invalidate(endpoint)
+            # Jira's edit-issue PUT returns 204 No Content on success, so an
+            # empty body is the success case, not something to parse
+            if not response.content:
+                return None
+            return fast_json.loads(response.content)
+        except (requests.exceptions.RequestException, ValueError) as e:
             handle_request_exception(e, f"Error during PUT request to {endpoint}")
             return None
+
+    def paged_get(self, endpoint, params=None, batch_size=100, items_key="issues"):
+        """
+        Yield decoded pages from a paginated Jira endpoint one at a time.
+
+        Each page can be processed and garbage-collected before the next one
+        is fetched, so peak memory stays bounded by the page size rather than
+        the total result size.
+
+        :param endpoint: API endpoint relative to the base URL.
+        :param params: Base query parameters (startAt/maxResults are managed).
+        :param batch_size: Page size for each request.
+        :param items_key: Response key holding the page's item list.
+        """
+        params = dict(params or {})
+        params["maxResults"] = batch_size
+        start_at = 0
+        while True:
+            params["startAt"] = start_at
+            page = self.get(endpoint, params=params, cache=False)
+            if not page:
+                return
+
+            yield page
+
+            items = page.get(items_key, [])
+            start_at += len(items)
+            if start_at >= page.get("total", 0) or not items:
+                return
+
+    def stream_get(self, endpoint, params=None, items_path="issues.item"):
+        """
+        Yield items incrementally from a large JSON response.
+
+        With ijson installed, the response body is parsed straight off the
+        socket and each item is yielded as soon as it decodes, so peak
+        memory is one item instead of the whole payload plus its parsed
+        object tree. Without ijson, falls back to a regular full-body GET.
+
+        :param endpoint: API endpoint relative to the base URL.
+        :param params: Optional query parameters.
+        :param items_path: ijson path of the repeated items to yield.
+        """
+        if ijson is None:
+            result = self.get(endpoint, params=params, cache=False)
+            items_key = items_path.split(".", 1)[0]
+            yield from (result or {}).get(items_key, [])
+            return
+
+        response = None
+        try:
+            response = self.session.get(
+                self._url(endpoint), params=params, stream=True
+            )
+            response.raise_for_status()
+            # Let urllib3 decompress gzip transparently before ijson sees it
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, items_path)
+        except requests.exceptions.RequestException as e:
+            handle_request_exception(
+                e, f"Error during streaming GET request to {endpoint}"
+            )
+        finally:
+            if response is not None:
+                response.close()
+
+    def search(
+        self,
+        jql,
+        fields=("summary", "status", "customfield_10015", "duedate"),
+        batch_size=100,
+    ):
+        """
+        Run a paged JQL search, yielding issues one by one.
+
+        Requesting an explicit field allow-list and a larger page size cuts
+        both bytes on the wire and the number of round-trips compared with
+        Jira's 50-issue, all-fields defaults.
+
+        :param jql: The JQL query to execute.
+        :param fields: Iterable of field names to request per issue.
+        :param batch_size: Page size for each request.
+        """
+        params = {"jql": jql, "fields": ",".join(fields)}
+        for page in self.paged_get("search", params=params, batch_size=batch_size):
+            yield from page.get("issues", [])
+
+    def get_many(self, calls, max_workers=8):
+        """
+        Execute multiple GET requests concurrently through the shared session.
+
+        :param calls: Iterable of (endpoint, params) tuples.
+        :param max_workers: Maximum number of concurrent requests.
+        :return: List of responses in the same order as `calls`.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.get, endpoint, params)
+                for endpoint, params in calls
+            ]
+            return [future.result() for future in futures]
+
+    def post_many(self, calls, max_workers=8):
+        """
+        Execute multiple POST requests concurrently through the shared session.
+
+        :param calls: Iterable of (endpoint, payload) tuples.
+        :param max_workers: Maximum number of concurrent requests.
+        :return: List of responses in the same order as `calls`.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.post, endpoint, payload)
+                for endpoint, payload in calls
+            ]
+            return [future.result() for future in futures]
+
+    def put_many(self, calls, max_workers=8):
+        """
+        Execute multiple PUT requests concurrently through the shared session.
+
+        :param calls: Iterable of (endpoint, payload) tuples.
+        :param max_workers: Maximum number of concurrent requests.
+        :return: List of responses in the same order as `calls`.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.put, endpoint, payload)
+                for endpoint, payload in calls
+            ]
+            return [future.result() for future in futures]
+
+    def close(self):
+        """Close the underlying session and release pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
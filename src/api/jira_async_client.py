@@ -0,0 +1,91 @@
+import logging
+
+try:
+    import httpx
+except ImportError:  # httpx is optional; callers fall back to the sync client
+    httpx = None
+
+from config import get_settings
+from src.utils import fast_json
+from src.utils.error_handler import JiraApiError
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncJiraClient:
+    """
+    Asynchronous Jira API client backed by httpx.AsyncClient.
+
+    A single shared client multiplexes many in-flight requests over a
+    bounded connection pool, so N independent JQL queries overlap their
+    network waits instead of running back to back. Exposes an async
+    get/post/put surface mirroring JiraApiClient.
+    """
+
+    def __init__(self, base_url=None):
+        """Initialize the async client; requires httpx to be installed."""
+        if httpx is None:
+            raise ImportError(
+                "httpx is required for the async Jira client; "
+                "install httpx or use the 'generic' client."
+            )
+
+        settings = get_settings()
+        self.base_url = base_url or f"{settings.JIRA_URL}/rest/api/3/"
+        self.client = httpx.AsyncClient(
+            http2=True,
+            auth=(settings.EMAIL, settings.API_TOKEN),
+            headers={
+                "Accept": "application/json",
+                "Accept-Encoding": "gzip",
+                "Content-Type": "application/json",
+            },
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+
+    async def get(self, endpoint, params=None):
+        """Make an async GET request to the Jira API."""
+        try:
+            response = await self.client.get(
+                f"{self.base_url}{endpoint}", params=params
+            )
+            response.raise_for_status()
+            return fast_json.loads(response.content)
+        except httpx.HTTPError as e:
+            logger.error(f"Error during GET request to {endpoint}: {e}")
+            raise JiraApiError(f"Error during GET request to {endpoint}")
+
+    async def post(self, endpoint, payload):
+        """Make an async POST request to the Jira API."""
+        try:
+            response = await self.client.post(
+                f"{self.base_url}{endpoint}", content=fast_json.dumps(payload)
+            )
+            response.raise_for_status()
+            return fast_json.loads(response.content)
+        except httpx.HTTPError as e:
+            logger.error(f"Error during POST request to {endpoint}: {e}")
+            raise JiraApiError(f"Error during POST request to {endpoint}")
+
+    async def put(self, endpoint, payload):
+        """Make an async PUT request to the Jira API."""
+        try:
+            response = await self.client.put(
+                f"{self.base_url}{endpoint}", content=fast_json.dumps(payload)
+            )
+            response.raise_for_status()
+            return fast_json.loads(response.content)
+        except httpx.HTTPError as e:
+            logger.error(f"Error during PUT request to {endpoint}: {e}")
+            raise JiraApiError(f"Error during PUT request to {endpoint}")
+
+    async def close(self):
+        """Close the underlying connection pool."""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
@@ -1,11 +1,22 @@
 import os
+from functools import lru_cache
+from types import SimpleNamespace
 
 from dotenv import load_dotenv
 
-# Load the environment variables from .env file
-load_dotenv()
 
-# Configuration Variables
-JIRA_URL = os.getenv("JIRA_URL")
-EMAIL = os.getenv("EMAIL")
-API_TOKEN = os.getenv("API_TOKEN")
+@lru_cache(maxsize=1)
+def get_settings():
+    """
+    Load the environment variables from the .env file on first use.
+
+    Deferring load_dotenv() to the first call keeps `import config` free of
+    file I/O, and the lru_cache guarantees the .env file is read only once
+    per process.
+    """
+    load_dotenv()
+    return SimpleNamespace(
+        JIRA_URL=os.getenv("JIRA_URL"),
+        EMAIL=os.getenv("EMAIL"),
+        API_TOKEN=os.getenv("API_TOKEN"),
+    )
@@ -4,12 +4,13 @@ import logging
 from src.services.managers.jira_manager import JiraManager
 from src.utils.logging_config import configure_logging
 
-# Configure logging for the CLI
-configure_logging()
 logger = logging.getLogger(__name__)
 
 
 def main():
+    # Configure logging once for the CLI entry point
+    configure_logging()
+
     # Set up argument parser
     parser = argparse.ArgumentParser(
         description=(
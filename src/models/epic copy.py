@@ -4,6 +4,37 @@ from typing import List, Optional
 import pandas as pd
 
 
+def _identity(value):
+    return value
+
+
+_SEMI = ";"
+
+
+def _split_semi(value):
+    # `type(value) is str` skips the subclass-aware isinstance dispatch; the
+    # single branch also passes lists through and maps None to an empty list.
+    return value.split(_SEMI) if type(value) is str else (value or [])
+
+
+def _to_ts(value):
+    return pd.to_datetime(value) if isinstance(value, str) else value
+
+
+# Per-field converters applied by from_dict; a single dict lookup replaces
+# the chain of isinstance/membership branches previously run for every field.
+_CONVERTERS = {
+    "components": _split_semi,
+    "fix_versions": _split_semi,
+    "labels": _split_semi,
+    "planned_start_date": _to_ts,
+    "planned_end_date": _to_ts,
+    "start_date": _to_ts,
+    "due_date": _to_ts,
+    "end_date": _to_ts,
+}
+
+
 @dataclass
 class Epic:
     """
@@ -110,32 +141,14 @@ class Epic:
         mandatory_fields = {
             k: data[k] for k in ["key", "summary", "status"] if k in data
         }
-        optional_fields = {k: v for k, v in data.items() if k not in mandatory_fields}
-
-        # Handle specific field types like lists or timestamp conversion
-        if "components" in optional_fields and isinstance(
-            optional_fields["components"], str
-        ):
-            optional_fields["components"] = optional_fields["components"].split(";")
-        if "fix_versions" in optional_fields and isinstance(
-            optional_fields["fix_versions"], str
-        ):
-            optional_fields["fix_versions"] = optional_fields["fix_versions"].split(";")
-        if "labels" in optional_fields and isinstance(optional_fields["labels"], str):
-            optional_fields["labels"] = optional_fields["labels"].split(";")
-        for date_field in [
-            "planned_start_date",
-            "planned_end_date",
-            "start_date",
-            "due_date",
-            "end_date",
-        ]:
-            if date_field in optional_fields and isinstance(
-                optional_fields[date_field], str
-            ):
-                optional_fields[date_field] = pd.to_datetime(
-                    optional_fields[date_field]
-                )
+
+        # Apply the per-field converter (list split / timestamp parse) via a
+        # single dispatch-table lookup instead of chained isinstance branches
+        optional_fields = {
+            k: _CONVERTERS.get(k, _identity)(v)
+            for k, v in data.items()
+            if k not in mandatory_fields
+        }
 
         return cls(**mandatory_fields, **optional_fields)
 
@@ -148,10 +161,8 @@ class Epic:
         """
         for key, value in data.items():
             if hasattr(self, key) and value is not None:
-                if key in ["components", "fix_versions", "labels"] and isinstance(
-                    value, str
-                ):
-                    value = value.split(";")
+                if key in ("components", "fix_versions", "labels"):
+                    value = _split_semi(value)
                 setattr(self, key, value)
 
     def serialize(self) -> dict:
@@ -1,15 +1,42 @@
 import datetime
 import logging
 from dataclasses import dataclass, fields
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import pandas as pd
 from workalendar.america import Brazil
 
+from src.utils import fast_json
+from src.utils.logging_config import configure_logging
+
 # Set up logging
-logging.basicConfig(level=logging.INFO)
+configure_logging()
 logger = logging.getLogger(__name__)
 
+# Shared calendar instance: building Brazil() computes holiday tables, so
+# construct it once instead of per epic. Safe to share, as workalendar
+# calendars are read-only after construction.
+_BR_CAL = Brazil()
+
+# Changelog scan constants: the statuses that bound the in-progress window
+# and the JIRA timestamp format, hoisted so they are not rebuilt per call.
+_STATUS_TARGETS = frozenset(("7 PI Started", "Done"))
+_CHANGELOG_DATE_FMT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+# Prefer ciso8601's C parser for JIRA ISO-8601 timestamps; it is orders of
+# magnitude faster than strptime on changelog-heavy epics. Fall back to the
+# stdlib when the extension is not installed.
+try:
+    import ciso8601
+
+    def _parse_jira_datetime(value: str) -> datetime.datetime:
+        return ciso8601.parse_datetime(value)
+
+except ImportError:
+
+    def _parse_jira_datetime(value: str) -> datetime.datetime:
+        return datetime.datetime.strptime(value, _CHANGELOG_DATE_FMT)
+
 # Excel column name to Epic attribute mapping, defined outside of the class
 excel_mapping = {
     "Key": "key",
@@ -42,8 +69,30 @@ excel_mapping = {
     "Labels": "labels",
 }
 
+# Column groups used by the vectorized from_dataframe conversion
+_DATE_COLS = [
+    "planned_start_date",
+    "planned_end_date",
+    "start_date",
+    "due_date",
+    "end_date",
+]
+_INT_COLS = [
+    "days_in_progress",
+    "remaining_work_days",
+    "planned_days",
+    "executed_days",
+    "devs_planned",
+    "devs_used",
+]
+
+# Frozen membership sets for the per-row update path; O(1) lookups instead
+# of rebuilding list literals and suffix checks inside the hot loop.
+_DATE_ATTRS = frozenset(_DATE_COLS)
+_INT_ATTRS = frozenset(_INT_COLS)
 
-@dataclass
+
+@dataclass(slots=True)
 class Epic:
     # Mandatory fields
     key: str
@@ -81,6 +130,48 @@ class Epic:
         """Check if this Epic matches the given key and summary."""
         return self.key == key and self.summary == summary
 
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> List["Epic"]:
+        """
+        Build a list of Epics from an Excel DataFrame using vectorized conversions.
+
+        Column-wide pd.to_datetime/pd.to_numeric calls run in C over whole
+        columns, avoiding the per-cell conversion cost of update_from_excel
+        when many epics are loaded at once.
+        """
+        try:
+            df = df.rename(columns=excel_mapping)
+            # Treat "-" placeholders as missing values before conversion
+            df = df.replace("-", pd.NA)
+
+            date_cols = [col for col in _DATE_COLS if col in df.columns]
+            if date_cols:
+                df[date_cols] = df[date_cols].apply(pd.to_datetime, errors="coerce")
+
+            int_cols = [col for col in _INT_COLS if col in df.columns]
+            if int_cols:
+                df[int_cols] = (
+                    df[int_cols]
+                    .apply(pd.to_numeric, errors="coerce")
+                    .astype("Int64")
+                )
+
+            known_fields = set(_EPIC_FIELDS)
+            epics = []
+            for record in df.to_dict("records"):
+                kwargs = {
+                    key: (None if pd.isna(value) else value)
+                    for key, value in record.items()
+                    if key in known_fields
+                }
+                epics.append(cls(**kwargs))
+
+            logger.info(f"Built {len(epics)} epics from DataFrame.")
+            return epics
+        except Exception as e:
+            logger.error(f"Failed to build epics from DataFrame: {e}")
+            return []
+
     def update_from_excel(
         self, excel_data: Dict[str, Any], excel_mapping: Dict[str, str]
     ) -> None:
@@ -95,24 +186,25 @@ class Epic:
                 attr_name = excel_mapping.get(excel_column)
                 if attr_name:
                     # Check for specific data handling based on attribute type
-                    if attr_name.endswith("_date"):
-                        # Convert date columns
-                        setattr(self, attr_name, pd.to_datetime(value, errors="coerce"))
-                    elif attr_name in [
-                        "planned_days",
-                        "executed_days",
-                        "devs_planned",
-                        "devs_used",
-                        "days_in_progress",
-                        "remaining_work_days",
-                    ]:
+                    if attr_name in _DATE_ATTRS:
+                        # Parse scalar dates without pd.to_datetime, whose
+                        # per-scalar dispatch is heavy inside this loop
+                        if isinstance(value, str):
+                            try:
+                                value = pd.Timestamp(_parse_jira_datetime(value))
+                            except ValueError:
+                                value = pd.to_datetime(value, errors="coerce")
+                        elif not isinstance(value, (datetime.datetime, pd.Timestamp)):
+                            value = None
+                        setattr(self, attr_name, value)
+                    elif attr_name in _INT_ATTRS:
                         # Convert numeric values, setting None for non-numeric or empty values
                         setattr(
                             self,
                             attr_name,
                             (
                                 int(value)
-                                if pd.notna(value) and value is not None
+                                if value is not None and value == value
                                 else None
                             ),
                         )
@@ -143,9 +235,14 @@ class Epic:
             )
             self.assignee = fields.get("assignee", {}).get("displayName", self.assignee)
             self.labels = ", ".join(fields.get("labels", []))
-            self.start_date = pd.to_datetime(
-                fields.get("customfield_10015"), errors="coerce"
-            )
+            start_value = fields.get("customfield_10015")
+            if isinstance(start_value, str):
+                try:
+                    self.start_date = pd.Timestamp(_parse_jira_datetime(start_value))
+                except ValueError:
+                    self.start_date = pd.to_datetime(start_value, errors="coerce")
+            else:
+                self.start_date = pd.NaT
             self.due_date = pd.to_datetime(fields.get("duedate"), errors="coerce")
 
             # Calculate days in progress
@@ -163,26 +260,27 @@ class Epic:
             # Track the dates of "7 PI Started" and "Done" status changes
             status_changes = {"7 PI Started": None, "Done": None}
 
-            # Iterate through each history record in the changelog
-            for history in changelog.get("histories", []):
-                for item in history.get("items", []):
-                    # Check if the field is "status" and it is either "7 PI Started" or "Done"
-                    if item["field"] == "status" and item["toString"] in status_changes:
-                        # Set the status change date for either "7 PI Started" or "Done"
-                        status_changes[item["toString"]] = datetime.datetime.strptime(
-                            history["created"], "%Y-%m-%dT%H:%M:%S.%f%z"
-                        ).date()
-
-                # Stop iterating if both statuses have been set
-                if status_changes["7 PI Started"] and status_changes["Done"]:
-                    break
+            # Iterate through each history record in the changelog, parsing the
+            # history timestamp at most once and returning as soon as both
+            # target statuses are found.
+            for history in changelog.get("histories", ()):
+                created = None
+                for item in history.get("items", ()):
+                    if (
+                        item["field"] == "status"
+                        and item["toString"] in _STATUS_TARGETS
+                    ):
+                        if created is None:
+                            created = _parse_jira_datetime(
+                                history["created"]
+                            ).date()
+                        status_changes[item["toString"]] = created
 
-            # Calculate the working days between "7 PI Started" and "Done" if both dates are present
-            if status_changes["7 PI Started"] and status_changes["Done"]:
-                cal = Brazil()
-                return cal.get_working_days_delta(
-                    status_changes["7 PI Started"], status_changes["Done"]
-                )
+                # Stop scanning as soon as both statuses have been set
+                if status_changes["7 PI Started"] and status_changes["Done"]:
+                    return _BR_CAL.get_working_days_delta(
+                        status_changes["7 PI Started"], status_changes["Done"]
+                    )
 
             # Return None if either status is missing
             return None
@@ -194,15 +292,27 @@ class Epic:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert Epic object to a dictionary that can be JSON serialized."""
-
-        def serialize_value(value):
-            if pd.isna(value):
-                return None
-            if isinstance(value, pd.Timestamp):
-                return value.isoformat()
-            return value
-
         return {
-            field.name: serialize_value(getattr(self, field.name))
-            for field in fields(self)
+            name: _serialize_value(getattr(self, name)) for name in _EPIC_FIELDS
         }
+
+    def to_json(self) -> str:
+        """Serialize the Epic to a JSON string."""
+        return fast_json.dumps(self.to_dict())
+
+
+# Field names resolved once at import; dataclasses.fields() allocates a new
+# tuple on every call, which adds up when serializing thousands of epics.
+_EPIC_FIELDS = tuple(f.name for f in fields(Epic))
+
+
+def _serialize_value(value):
+    # Scalar checks instead of pd.isna: the pandas call builds a 1-element
+    # dispatch per value, which dominates when serializing thousands of epics.
+    if value is None or value is pd.NaT or value is pd.NA:
+        return None
+    if isinstance(value, float) and value != value:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    return value
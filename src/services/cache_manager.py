@@ -1,8 +1,12 @@
-import datetime
-import json
 import logging
+import mmap
 import os
+import time
+from collections import OrderedDict
 
+import pandas as pd
+
+from src.utils import fast_json
 from src.utils.error_handler import handle_generic_exception
 from src.utils.logging_config import configure_logging
 
@@ -10,6 +14,13 @@ from src.utils.logging_config import configure_logging
 configure_logging()
 logger = logging.getLogger(__name__)
 
+# Files above this size are memory-mapped instead of read into a bytes
+# object; below it the mmap setup cost outweighs the saved copy.
+_MMAP_THRESHOLD = 1 << 20
+
+# Maximum number of parsed cache payloads kept in the in-process memo.
+_MEMO_MAX = 64
+
 
 class CacheManager:
     """Service to manage caching of data using JSON files."""
@@ -27,12 +38,32 @@ class CacheManager:
             )
 
         self.cache_dir = cache_dir
+        # In-process LRU memo of parsed payloads keyed by file name, tagged
+        # with the file's mtime so a rewrite on disk invalidates the entry.
+        # Repeated loads of a hot key become a dict lookup instead of a
+        # reopen-and-reparse.
+        self._memo = OrderedDict()
         try:
             os.makedirs(self.cache_dir, exist_ok=True)
         except OSError as e:
-            logger.error(f"Failed to create cache directory at {self.cache_dir}: {e}")
+            logger.error("Failed to create cache directory at %s: %s", self.cache_dir, e)
             raise
 
+    def _memo_get(self, file_name, mtime):
+        """Return the memoized payload for `file_name` if still current."""
+        entry = self._memo.get(file_name)
+        if entry is not None and entry[0] == mtime:
+            self._memo.move_to_end(file_name)
+            return entry[1]
+        return None
+
+    def _memo_put(self, file_name, mtime, data):
+        """Store a parsed payload in the memo, evicting the oldest entry."""
+        self._memo[file_name] = (mtime, data)
+        self._memo.move_to_end(file_name)
+        if len(self._memo) > _MEMO_MAX:
+            self._memo.popitem(last=False)
+
     def load_from_cache(self, file_name, expiration_minutes=None):
         """
         Load data from a specified cache file.
@@ -44,27 +75,46 @@ class CacheManager:
         try:
             file_path = os.path.join(self.cache_dir, file_name)
             if not os.path.exists(file_path):
-                logger.info(f"Cache file '{file_name}' does not exist.")
+                logger.info("Cache file '%s' does not exist.", file_name)
                 return None
 
-            with open(file_path, "r") as file:
-                cache_data = json.load(file)
-                # Verify if the cache has expired
-                if expiration_minutes is not None:
-                    cached_time_str = cache_data.get("_cached_at")
-                    if cached_time_str:
-                        cached_time = datetime.datetime.fromisoformat(cached_time_str)
-                        if (
-                            datetime.datetime.now() - cached_time
-                        ).total_seconds() > expiration_minutes * 60:
-                            logger.info(f"Cache file '{file_name}' has expired.")
-                            return None
-
-                logger.info(f"Loaded data from cache file: {file_name}")
-                return cache_data.get("data")
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to decode JSON from cache file '{file_name}': {e}")
+            # Check freshness against file mtime before any parse: a stat()
+            # call is microseconds, decoding a multi-MB JSON only to discard
+            # it is orders of magnitude more
+            mtime = os.path.getmtime(file_path)
+            if expiration_minutes is not None:
+                if time.time() - mtime > expiration_minutes * 60:
+                    logger.info("Cache file '%s' has expired.", file_name)
+                    return None
+
+            memo_hit = self._memo_get(file_name, mtime)
+            if memo_hit is not None:
+                logger.info("Serving cache file '%s' from memory.", file_name)
+                return memo_hit
+
+            # Memory-map large files so the parser reads straight from the
+            # page cache instead of first copying the whole file into a
+            # bytes object; small files take the plain read path since the
+            # mmap setup would cost more than the copy it saves
+            with open(file_path, "rb") as file:
+                if os.path.getsize(file_path) > _MMAP_THRESHOLD:
+                    with mmap.mmap(
+                        file.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as buffer:
+                        cache_data = fast_json.loads(memoryview(buffer))
+                else:
+                    cache_data = fast_json.loads(file.read())
+
+            # Unwrap entries written before expiration moved to file mtime
+            if isinstance(cache_data, dict) and "_cached_at" in cache_data:
+                cache_data = cache_data.get("data")
+
+            self._memo_put(file_name, mtime, cache_data)
+            logger.info("Loaded data from cache file: %s", file_name)
+            return cache_data
+
+        except ValueError as e:
+            logger.error("Failed to decode JSON from cache file '%s': %s", file_name, e)
             return None
         except Exception as e:
             handle_generic_exception(
@@ -72,6 +122,61 @@ class CacheManager:
             )
             return None
 
+    def load_many(self, file_names, expiration_minutes=None):
+        """
+        Load several cache files with a single directory listing.
+
+        One os.scandir pass replaces a stat() syscall per file: each
+        DirEntry carries its metadata, so existence and freshness checks
+        need no further path resolution.
+
+        :param file_names: Iterable of cache file names to load.
+        :param expiration_minutes: Expiration time in minutes. If None, cache
+                                   entries are always considered valid.
+        :return: Dict mapping file name to loaded data for each fresh hit.
+        """
+        try:
+            entries = {entry.name: entry for entry in os.scandir(self.cache_dir)}
+        except OSError as e:
+            logger.error("Failed to scan cache directory %s: %s", self.cache_dir, e)
+            return {}
+
+        results = {}
+        now = time.time()
+        for file_name in file_names:
+            entry = entries.get(file_name)
+            if entry is None:
+                logger.info("Cache file '%s' does not exist.", file_name)
+                continue
+
+            mtime = entry.stat().st_mtime
+            if (
+                expiration_minutes is not None
+                and now - mtime > expiration_minutes * 60
+            ):
+                logger.info("Cache file '%s' has expired.", file_name)
+                continue
+
+            memo_hit = self._memo_get(file_name, mtime)
+            if memo_hit is not None:
+                results[file_name] = memo_hit
+                continue
+
+            try:
+                with open(entry.path, "rb") as file:
+                    data = fast_json.loads(file.read())
+                if isinstance(data, dict) and "_cached_at" in data:
+                    data = data.get("data")
+                self._memo_put(file_name, mtime, data)
+                results[file_name] = data
+            except ValueError as e:
+                logger.error(
+                    "Failed to decode JSON from cache file '%s': %s", file_name, e
+                )
+
+        logger.info("Loaded %d of %d requested cache files.", len(results), len(file_names))
+        return results
+
     def save_to_cache(self, file_name, data):
         """
         Save data to a specified cache file.
@@ -81,17 +186,18 @@ class CacheManager:
         """
         try:
             file_path = os.path.join(self.cache_dir, file_name)
-            cache_data = {
-                "data": data,
-                "_cached_at": datetime.datetime.now().isoformat(),
-            }
+            # Compact fast_json output: no pretty-printing, so roughly half
+            # the bytes hit the disk compared with the old indent=4 dumps.
+            # Expiration is tracked via file mtime, so the payload is stored
+            # directly without a metadata wrapper.
             with open(file_path, "w") as file:
-                json.dump(cache_data, file, indent=4)
-            logger.info(f"Data successfully saved to cache file: {file_name}")
+                file.write(fast_json.dumps(data))
+            self._memo.pop(file_name, None)
+            logger.info("Data successfully saved to cache file: %s", file_name)
 
         except OSError as e:
             logger.error(
-                f"Failed to write cache file '{file_name}' at '{file_path}': {e}"
+                "Failed to write cache file '%s' at '%s': %s", file_name, file_path, e
             )
             raise
         except Exception as e:
@@ -99,6 +205,64 @@ class CacheManager:
                 e, f"Failed to save data to cache file '{file_name}'"
             )
 
+    def load_dataframe_from_cache(self, file_name, expiration_minutes=None):
+        """
+        Load a DataFrame from a Parquet cache file.
+
+        :param file_name: The name of the Parquet cache file to load from.
+        :param expiration_minutes: Expiration time in minutes, checked against
+                                   the file's mtime. If None, cache is always valid.
+        :return: The cached DataFrame if available and fresh, otherwise None.
+        """
+        try:
+            file_path = os.path.join(self.cache_dir, file_name)
+            if not os.path.exists(file_path):
+                logger.info("Cache file '%s' does not exist.", file_name)
+                return None
+
+            if expiration_minutes is not None:
+                age_seconds = time.time() - os.path.getmtime(file_path)
+                if age_seconds > expiration_minutes * 60:
+                    logger.info("Cache file '%s' has expired.", file_name)
+                    return None
+
+            df = pd.read_parquet(file_path)
+            logger.info("Loaded DataFrame from cache file: %s", file_name)
+            return df
+
+        except Exception as e:
+            handle_generic_exception(
+                e, f"Unexpected error while loading cache file '{file_name}'"
+            )
+            return None
+
+    def save_dataframe_to_cache(self, file_name, df):
+        """
+        Save a DataFrame to a Parquet cache file.
+
+        Parquet keeps the columnar dtypes and compresses numeric data far
+        better than JSON text, avoiding the float->str->float round-trip on
+        tabular payloads. Expiration is tracked via file mtime, so no
+        metadata wrapper is needed.
+
+        :param file_name: The name of the Parquet cache file to save to.
+        :param df: The DataFrame to be cached.
+        """
+        try:
+            file_path = os.path.join(self.cache_dir, file_name)
+            df.to_parquet(file_path, compression="zstd")
+            logger.info("DataFrame successfully saved to cache file: %s", file_name)
+
+        except OSError as e:
+            logger.error(
+                "Failed to write cache file '%s' at '%s': %s", file_name, file_path, e
+            )
+            raise
+        except Exception as e:
+            handle_generic_exception(
+                e, f"Failed to save DataFrame to cache file '{file_name}'"
+            )
+
     def invalidate_cache(self, file_name):
         """
         Invalidate a specified cache file by deleting it.
@@ -106,13 +270,14 @@ class CacheManager:
         :param file_name: The name of the cache file to invalidate.
         """
         try:
+            self._memo.pop(file_name, None)
             file_path = os.path.join(self.cache_dir, file_name)
             if os.path.exists(file_path):
                 os.remove(file_path)
-                logger.info(f"Cache file '{file_name}' invalidated successfully.")
+                logger.info("Cache file '%s' invalidated successfully.", file_name)
             else:
                 logger.warning(
-                    f"Cache file '{file_name}' does not exist to invalidate."
+                    "Cache file '%s' does not exist to invalidate.", file_name
                 )
 
         except Exception as e:
@@ -3,8 +3,10 @@ import os
 
 import pandas as pd
 
+from src.utils.logging_config import configure_logging
+
 # Set up logging
-logging.basicConfig(level=logging.INFO)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -18,58 +20,131 @@ class ExcelReader:
         :param file_path: Path to the Excel file.
         """
         if not os.path.exists(file_path):
-            logger.error(f"Excel file not found at: {file_path}")
+            logger.error("Excel file not found at: %s", file_path)
             raise FileNotFoundError(f"Excel file not found at: {file_path}")
         self.file_path = file_path
 
-    def read_data(self, sheet_name=None):
+    def read_data(self, sheet_name=None, columns=None, dtypes=None):
         """
         Read data from the Excel file, optionally specifying a sheet name.
 
+        Passing `columns` limits parsing to the named columns, and `dtypes`
+        skips pandas' per-column type inference; both cut parse time and
+        memory in proportion to how little of the sheet is actually used.
+
         :param sheet_name: The name of the sheet to read from. If None, the first sheet is used.
+        :param columns: Optional list of column names to read (pandas `usecols`).
+        :param dtypes: Optional mapping of column name to dtype (pandas `dtype`).
         :return: Data read from the Excel file as a pandas DataFrame.
         """
         try:
-            data = pd.read_excel(self.file_path, sheet_name=sheet_name)
+            # Serve from the Parquet sidecar when it is newer than the
+            # workbook: re-reading Parquet is 10-50x faster than any Excel
+            # parser, so repeat loads skip the XML parse entirely. Parquet
+            # is columnar, so the projection comes for free on this path.
+            sidecar_path = f"{self.file_path}.{sheet_name or 'default'}.parquet"
+            if os.path.exists(sidecar_path) and os.path.getmtime(
+                sidecar_path
+            ) >= os.path.getmtime(self.file_path):
+                logger.info("Loading cached Parquet sidecar: %s", sidecar_path)
+                return pd.read_parquet(sidecar_path, columns=columns)
+
+            try:
+                # calamine is a Rust-backed engine, typically 5-20x faster
+                # than the default pure-Python openpyxl parser
+                data = pd.read_excel(
+                    self.file_path,
+                    sheet_name=sheet_name,
+                    usecols=columns,
+                    dtype=dtypes,
+                    engine="calamine",
+                )
+            except ImportError:
+                data = pd.read_excel(
+                    self.file_path,
+                    sheet_name=sheet_name,
+                    usecols=columns,
+                    dtype=dtypes,
+                )
+
             logger.info(
-                f"Data read successfully from Excel file: {self.file_path}, "
-                f"Sheet: {sheet_name or 'first'}"
+                "Data read successfully from Excel file: %s, Sheet: %s",
+                self.file_path,
+                sheet_name or "first",
             )
+
+            # Only cache full-sheet reads: a projected subset must not
+            # shadow the complete sheet for later callers
+            if columns is None:
+                try:
+                    data.to_parquet(sidecar_path)
+                except Exception as e:
+                    # The sidecar is purely an optimization; never fail the read
+                    logger.warning("Could not write Parquet sidecar: %s", e)
+
             return data
         except ValueError as e:
             logger.error(
-                f"Error while reading sheet '{sheet_name}' from Excel file {self.file_path}: {e}"
+                "Error while reading sheet '%s' from Excel file %s: %s",
+                sheet_name,
+                self.file_path,
+                e,
             )
             return None
         except Exception as e:
             logger.error(
-                f"Unexpected error while reading Excel file {self.file_path}: {e}"
+                "Unexpected error while reading Excel file %s: %s", self.file_path, e
             )
             return None
 
-    def read_data_as_dict(self, sheet_name=None, key_column=None):
+    def read_data_as_indexed(self, sheet_name=None, key_column=None):
         """
-        Read data from the Excel file and return it as a dictionary.
+        Read data from the Excel file indexed by a key column.
+
+        Returns the DataFrame itself with `key_column` as index, so lookups
+        run as `.loc[key]`/`.at[key, col]` without materializing one Python
+        dict per row.
 
         :param sheet_name: The name of the sheet to read from.
-        :param key_column: The column to use as keys for the dictionary.
-        :return: Data as a dictionary where keys are the values from `key_column`.
+        :param key_column: The column to use as the index.
+        :return: DataFrame indexed by `key_column`, or None on failure.
         """
         try:
             df = self.read_data(sheet_name)
             if df is None:
                 return None
             if key_column and key_column in df.columns:
-                data_dict = df.set_index(key_column).to_dict(orient="index")
-                logger.info(
-                    f"Data from Excel file {self.file_path} read as dictionary successfully."
-                )
-                return data_dict
+                return df.set_index(key_column)
             else:
                 logger.warning(
-                    f"Key column '{key_column}' not found in the Excel sheet."
+                    "Key column '%s' not found in the Excel sheet.", key_column
                 )
                 return None
         except Exception as e:
-            logger.error(f"Error while converting Excel data to dictionary: {e}")
+            logger.error("Error while indexing Excel data: %s", e)
+            return None
+
+    def read_data_as_dict(self, sheet_name=None, key_column=None):
+        """
+        Read data from the Excel file and return it as a dictionary.
+
+        Prefer read_data_as_indexed for lookup-only callers; this method
+        materializes a dict per row, which is O(rows x cols) object churn.
+
+        :param sheet_name: The name of the sheet to read from.
+        :param key_column: The column to use as keys for the dictionary.
+        :return: Data as a dictionary where keys are the values from `key_column`.
+        """
+        try:
+            indexed = self.read_data_as_indexed(sheet_name, key_column)
+            if indexed is None:
+                return None
+            data_dict = indexed.to_dict(orient="index")
+            logger.info(
+                "Data from Excel file %s read as dictionary successfully.",
+                self.file_path,
+            )
+            return data_dict
+        except Exception as e:
+            logger.error("Error while converting Excel data to dictionary: %s", e)
             return None
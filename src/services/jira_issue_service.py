@@ -1,62 +1,688 @@
+import asyncio
+import atexit
 import datetime
+import hashlib
 import logging
-
-from atlassian_doc_builder import ADFDoc, ADFParagraph, ADFText
+import os
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass
 
 from src.api.factory import JiraApiFactory
+from src.api.jira_async_client import AsyncJiraClient
 from src.services.cache_manager import CacheManager
-from src.utils.error_handler import handle_generic_exception
-from src.utils.logging_config import configure_logging
+from src.utils.error_handler import JiraApiError, handle_generic_exception
 
-# Configure logging
-configure_logging()
+# Logging is configured once at the application entry point
 logger = logging.getLogger(__name__)
 
+# Maximum entries in the per-service in-memory metadata cache.
+_MEM_CACHE_MAX = 256
+
+# Worker count for the shared service thread pool, tunable per deployment.
+_WORKER_COUNT = int(os.getenv("FORESIGHT_JIRA_WORKERS", "8"))
+
+# Explicit field allow-lists for the dashboard queries. Asking Jira for
+# fields="*" serializes every custom field (descriptions, comments, ...) on
+# every issue; these lists keep responses to what the consumers actually
+# read. "updated" stays in so the cache watermark keeps working, and the
+# squad dropdown (customfield_10265) is needed for bulk bucketing.
+_EPIC_FIELDS = (
+    "key,summary,status,assignee,labels,duedate,resolutiondate,updated,"
+    "customfield_10015,customfield_10233,customfield_10265"
+)
+_OPEN_ISSUE_FIELDS = (
+    "key,summary,status,priority,assignee,duedate,updated,"
+    "customfield_10015,customfield_10265"
+)
+
+
+def _cache_key(*parts):
+    """
+    Build a stable cache-key digest from the given parameters.
+
+    The builtin `hash` is randomized per interpreter run, so keys derived
+    from it never survive a process restart; blake2b gives a deterministic,
+    collision-resistant digest that is also safe to use as a filename
+    regardless of what characters the parameters contain.
+
+    :param parts: Values that affect the response being cached.
+    :return: Hex digest string suitable for a cache filename.
+    """
+    payload = "\x1f".join(str(part) for part in parts)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _normalize_fields(fields):
+    """
+    Canonicalize a comma-separated field list for cache-key purposes.
+
+    Sorting makes "a,b" and "b,a" share one cache entry; the request
+    itself still sends the caller's original string.
+    """
+    return ",".join(sorted(part.strip() for part in fields.split(",")))
+
+
+def _days_ago(days):
+    """Return the ISO date `days` days before today, for day-stable JQL."""
+    return (datetime.date.today() - datetime.timedelta(days=days)).isoformat()
+
+
+# Jira changelog timestamp format, used only when fromisoformat cannot
+# handle an entry (pre-3.11 interpreters).
+_CHANGELOG_FMT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+
+def _history_date(created):
+    """Parse a changelog `created` timestamp to a date."""
+    try:
+        # fromisoformat is a C-level parser, far cheaper than strptime's
+        # per-call format-string interpretation
+        return datetime.datetime.fromisoformat(created).date()
+    except ValueError:
+        return datetime.datetime.strptime(created, _CHANGELOG_FMT).date()
+
+
+def _issues_watermark(issues):
+    """Return the latest fields.updated timestamp across issues, or None."""
+    watermark = None
+    for issue in issues:
+        updated = issue.get("fields", {}).get("updated")
+        if updated and (watermark is None or updated > watermark):
+            watermark = updated
+    return watermark
+
+
+def _issue_squad(issue):
+    """Return the squad name an issue belongs to, or None."""
+    squad = issue.get("fields", {}).get("customfield_10265")
+    if isinstance(squad, dict):
+        return squad.get("value")
+    return squad
+
+
+# Field-type handlers for build_payload_from_metadata, defined once at
+# module level instead of re-creating ~15 closures on every call. Each
+# takes the field metadata, the raw value, and the precomputed
+# allowed-values map for that field (may be empty).
+def _handle_string(field, value, allowed_values):
+    return value
+
+
+def _handle_adf_string(value):
+    """
+    Convert a plain string to an ADF document.
+
+    The result is a fixed three-node tree, so a dict literal replaces the
+    former ADFDoc/ADFParagraph/ADFText object graph and its validation
+    pass — three allocations and a schema walk saved per description.
+    """
+    content = []
+    if value:
+        content.append(
+            {"type": "paragraph", "content": [{"type": "text", "text": value}]}
+        )
+    return {"type": "doc", "version": 1, "content": content}
+
+
+def _handle_array(field, value, allowed_values):
+    # Callers that already resolved IDs pass [{"id": ...}, ...]; send those
+    # through untouched instead of re-validating against allowed values
+    if value and isinstance(value[0], dict) and "id" in value[0]:
+        return value
+    if allowed_values:
+        # Validate each item in array
+        invalid_items = [item for item in value if item not in allowed_values]
+        if invalid_items:
+            raise ValueError(
+                f"Invalid values '{invalid_items}' for field '{field['key']}'."
+            )
+        return [{"id": allowed_values[item]} for item in value]
+    return value
+
+
+def _handle_attachment(field, value, allowed_values):
+    return [{"id": v} for v in value]
+
+
+def _handle_boolean(field, value, allowed_values):
+    if not isinstance(value, bool):
+        raise ValueError(
+            f"Expected boolean for '{field['key']}', got {type(value).__name__}."
+        )
+    return value
+
+
+def _handle_component(field, value, allowed_values):
+    return [{"id": v} for v in value]
+
+
+def _handle_date(field, value, allowed_values):
+    if not isinstance(value, str) or len(value.split("-")) != 3:
+        raise ValueError(
+            f"Expected date format 'YYYY-MM-DD' for '{field['key']}'."
+        )
+    return value
+
+
+def _handle_number(field, value, allowed_values):
+    if not isinstance(value, (int, float)):
+        raise ValueError(
+            f"Expected number for '{field['key']}', got {type(value).__name__}."
+        )
+    return value
+
+
+def _handle_option(field, value, allowed_values):
+    # Already-resolved {"id": ...} values skip the allowed-values lookup
+    if isinstance(value, dict) and "id" in value:
+        return value
+    if value not in allowed_values:
+        raise ValueError(f"Invalid value '{value}' for field '{field['key']}'.")
+    return {"id": allowed_values[value]}
+
+
+def _handle_priority(field, value, allowed_values):
+    # Already-resolved {"id": ...} values skip the allowed-values lookup
+    if isinstance(value, dict) and "id" in value:
+        return value
+    if value not in allowed_values:
+        raise ValueError(
+            f"Invalid value '{value}' for priority field '{field['key']}'."
+        )
+    return {"id": allowed_values[value]}
+
+
+def _handle_project(field, value, allowed_values):
+    return {"id": value}
+
+
+def _handle_user(field, value, allowed_values):
+    return {"accountId": value}
+
+
+def _handle_version(field, value, allowed_values):
+    return [{"id": v} for v in value]
+
+
+def _handle_issuelink(field, value, allowed_values):
+    return {"key": value}
+
+
+# Map of field types to handler functions; "issuetype" is resolved inline
+# in build_payload_from_metadata since it depends on the call's issuetype_id.
+_FIELD_HANDLERS = {
+    "string": _handle_string,
+    "array": _handle_array,
+    "attachment": _handle_attachment,
+    "boolean": _handle_boolean,
+    "component": _handle_component,
+    "date": _handle_date,
+    "datetime": _handle_date,
+    "number": _handle_number,
+    "option": _handle_option,
+    "priority": _handle_priority,
+    "project": _handle_project,
+    "user": _handle_user,
+    "version": _handle_version,
+    "issuelink": _handle_issuelink,
+    "parent": _handle_issuelink,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class _MetaIndex:
+    """Precomputed lookup structures for one issue-type metadata dict."""
+
+    fields_by_key: dict
+    allowed_index: dict
+    required_keys: frozenset
+    defaulted_keys: frozenset
+
+
+# Index cache keyed by metadata object identity, guarded against id reuse
+# by also storing the metadata itself; repeated bulk-create calls with the
+# same cached metadata dict reuse one index instead of rebuilding it.
+# Bounded to a handful of entries (a process works with few issue types at
+# a time) so evicted metadata dicts can be garbage collected instead of
+# being pinned for the life of the process.
+_metadata_index_cache = OrderedDict()
+_METADATA_INDEX_MAX = 8
+
+
+def _index_metadata(metadata):
+    """
+    Build the lookup index for a metadata dict.
+
+    Replaces the former per-field linear scan of metadata["fields"] and the
+    per-field rebuild of allowed-values maps with one O(fields) pass whose
+    result is memoized per metadata object. Required and defaulted keys are
+    frozensets so the missing-fields check at the end of payload building
+    is pure set membership instead of a dict comprehension per call.
+    """
+    cached = _metadata_index_cache.get(id(metadata))
+    if cached is not None and cached[0] is metadata:
+        _metadata_index_cache.move_to_end(id(metadata))
+        return cached[1]
+
+    fields_by_key = {field["key"]: field for field in metadata["fields"]}
+    allowed_index = {}
+    for field in metadata["fields"]:
+        allowed = field.get("allowedValues")
+        if not allowed:
+            continue
+        # Option values are matched by "value"; everything else by "name"
+        name_key = "value" if field["schema"]["type"] == "option" else "name"
+        allowed_index[field["key"]] = {
+            v[name_key]: v["id"] for v in allowed if name_key in v
+        }
+    required_keys = frozenset(
+        field["key"] for field in metadata["fields"] if field["required"]
+    )
+    defaulted_keys = frozenset(
+        field["key"]
+        for field in metadata["fields"]
+        if field["required"] and field.get("hasDefaultValue", False)
+    )
+
+    index = _MetaIndex(fields_by_key, allowed_index, required_keys, defaulted_keys)
+    _metadata_index_cache[id(metadata)] = (metadata, index)
+    _metadata_index_cache.move_to_end(id(metadata))
+    if len(_metadata_index_cache) > _METADATA_INDEX_MAX:
+        _metadata_index_cache.popitem(last=False)
+    return index
+
 
 class JiraIssueService:
     """Service to handle operations related to Jira issues of any type."""
 
+    # Lazily-created thread pool shared by every service instance and entry
+    # point, so repeated calls reuse threads instead of paying pool creation
+    # per operation.
+    _executor = None
+
     def __init__(self):
         """Initialize the service with a Jira API client and a cache manager."""
         factory = JiraApiFactory()
         self.client = factory.get_client("generic")
         self.cache_manager = CacheManager()
+        # Created on first async use so sync-only callers never pay for it
+        self._async_client = None
+        # In-memory LRU in front of the file cache for read-mostly metadata:
+        # repeated hits inside one process cost a dict lookup, no syscalls
+        self._mem_cache = OrderedDict()
+
+    @classmethod
+    def _get_executor(cls):
+        """Return the shared executor, creating it on first use."""
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=_WORKER_COUNT)
+            atexit.register(cls._executor.shutdown, wait=False)
+        return cls._executor
 
     def fetch_issues(
-        self, jql_query, fields="*", max_results=100, expand_changelog=False
+        self,
+        jql_query,
+        fields="*",
+        max_results=None,
+        expand_changelog=False,
+        batch_size=500,
     ):
         """
-        Fetch issues from Jira using a JQL query.
+        Fetch issues from Jira using a JQL query, paginating until exhaustion.
+
+        Large pages cut the number of round-trips dramatically for JQLs
+        matching thousands of issues, and pagination removes the former
+        silent truncation at a single page.
 
         :param jql_query: The JQL query to execute.
         :param fields: Fields to include in the response.
-        :param max_results: Maximum number of results to fetch.
+        :param max_results: Absolute cap on issues returned; None fetches all.
         :param expand_changelog: Whether to include changelog data.
+        :param batch_size: Page size per request (the server may clamp it).
         :return: List of issues.
         """
         try:
+            # Generate a cache key covering every parameter that shapes the
+            # response, so e.g. the same JQL with different fields or limits
+            # never collides on one entry
+            digest = _cache_key(
+                jql_query, _normalize_fields(fields), max_results, expand_changelog
+            )
+            cache_file = f"issues_cache_{digest}.json"
+            # Cache validity is decided by a Jira `updated` watermark rather
+            # than a flat TTL: a zero-result probe for anything updated since
+            # the cached snapshot proves the cache is current, so unchanged
+            # queries stay cached indefinitely while edits invalidate at once.
+            # Changelog queries keep the plain 60-minute TTL, since the probe
+            # cannot see changelog-only differences.
             if expand_changelog:
-                fields += ",changelog"
+                cached_entry = self.cache_manager.load_from_cache(
+                    cache_file, expiration_minutes=60
+                )
+            else:
+                cached_entry = self.cache_manager.load_from_cache(cache_file)
+            if cached_entry:
+                if isinstance(cached_entry, dict) and "payload" in cached_entry:
+                    payload = cached_entry["payload"]
+                    watermark = cached_entry.get("watermark")
+                else:
+                    payload, watermark = cached_entry, None
+                if expand_changelog or (
+                    watermark and self._is_cache_fresh(jql_query, watermark)
+                ):
+                    logger.info(f"Loaded issues from cache for JQL: {jql_query}")
+                    return payload
 
-            # Generate a cache key based on the query parameters
-            cache_file = f"issues_cache_{hash(jql_query)}.json"
-            cached_data = self.cache_manager.load_from_cache(
+            # Fetch from Jira API if no valid cache is found
+            logger.info(f"Fetching issues with JQL: {jql_query}")
+            all_issues = []
+            start_at = 0
+            failed = False
+
+            # changelog is an expand in Jira's REST API, not a field;
+            # requesting it as a field shipped a wrong query and left
+            # the parameter string mutated for incremental callers
+            base_params = {"jql": jql_query, "fields": fields}
+            if expand_changelog:
+                base_params["expand"] = "changelog"
+
+            # Resume from pages saved by a previous run that hit a persistent
+            # failure mid-pagination, instead of refetching them
+            partial_file = f"partial_{cache_file}"
+            partial = self.cache_manager.load_from_cache(
+                partial_file, expiration_minutes=60
+            )
+            if partial:
+                logger.info(
+                    "Resuming pagination from %d previously fetched issues.",
+                    len(partial),
+                )
+                all_issues = list(partial)
+                start_at = len(all_issues)
+
+            # Probe for the total with an empty page, then dispatch all page
+            # requests concurrently and stitch them back in offset order;
+            # the wall-clock cost becomes one round-trip plus the slowest
+            # page instead of one round-trip per page.
+            # cache=False on the probe and every page: letting search bodies
+            # sit in the client's TTL cache would hand a post-invalidation
+            # refetch the very stale pages the watermark just rejected, and
+            # the executor threads would mutate a non-thread-safe TTLCache
+            try:
+                probe = self.client.get(
+                    "search",
+                    params={**base_params, "startAt": 0, "maxResults": 1},
+                    cache=False,
+                )
+            except JiraApiError:
+                # The session layer already retried with backoff; treat a
+                # persistent probe failure like an empty probe so partial
+                # progress from a previous run is returned, not discarded
+                probe = None
+            if not probe:
+                failed = True
+                total = 0
+            else:
+                total = probe.get("total", 0)
+                if max_results is not None:
+                    total = min(total, max_results)
+
+            # The first page is fetched on its own to learn the server's
+            # effective page size: Jira clamps maxResults (100 on /search)
+            # and echoes the clamped value back, so requesting batch_size
+            # blindly would leave gaps between the offsets dispatched below.
+            page_size = batch_size
+            next_start = start_at
+            if not failed and total > next_start:
+                response = self._fetch_page(
+                    base_params, next_start, min(page_size, total - next_start)
+                )
+                if not response:
+                    failed = True
+                else:
+                    issues = response.get("issues", [])
+                    all_issues.extend(issues)
+                    next_start += len(issues)
+                    effective = response.get("maxResults") or page_size
+                    if 0 < effective < page_size:
+                        logger.info(
+                            "Server clamped the page size to %d "
+                            "(requested %d); re-chunking accordingly.",
+                            effective,
+                            page_size,
+                        )
+                        page_size = effective
+                    if not issues and next_start < total:
+                        # An empty page despite a larger total would loop
+                        # forever below; treat it as a failed fetch
+                        failed = True
+
+            # Dispatch the remaining offsets concurrently and stitch them
+            # back in order; the wall-clock cost is the slowest page, not
+            # the sum. A round that comes back short (the result set shrank
+            # under us) re-chunks from the actual position and retries.
+            while not failed and next_start < total:
+                page_starts = list(range(next_start, total, page_size))
+                futures = {
+                    self._get_executor().submit(
+                        self._fetch_page,
+                        base_params,
+                        page_start,
+                        min(page_size, total - page_start),
+                    ): page_start
+                    for page_start in page_starts
+                }
+                pages = {
+                    futures[future]: future.result()
+                    for future in as_completed(futures)
+                }
+
+                for page_start in page_starts:
+                    response = pages.get(page_start)
+                    if not response:
+                        # The session layer already retried with backoff; a
+                        # missing page means the failure persisted. Keep only
+                        # the contiguous prefix so a resume stays correct.
+                        failed = True
+                        break
+                    issues = response.get("issues", [])
+                    all_issues.extend(issues)
+                    next_start = page_start + len(issues)
+                    if len(issues) < min(page_size, total - page_start):
+                        # Short page at the known-effective size: the result
+                        # set shrank mid-pagination. Pages after this offset
+                        # are misaligned, so drop them and re-chunk.
+                        logger.warning(
+                            "Got %d issues at offset %d; result set shrank, "
+                            "re-chunking the remaining pages.",
+                            len(issues),
+                            page_start,
+                        )
+                        break
+                else:
+                    break
+
+                if failed or next_start >= total:
+                    break
+                if not issues:
+                    # No forward progress on the short page; the shrunken
+                    # result set is exhausted even though total says more
+                    break
+
+            if failed:
+                if all_issues:
+                    self.cache_manager.save_to_cache(partial_file, all_issues)
+                    logger.warning(
+                        "Cached %d issues of partial progress after a "
+                        "persistent failure; the next call will resume.",
+                        len(all_issues),
+                    )
+                return all_issues
+
+            if max_results is not None:
+                all_issues = all_issues[:max_results]
+
+            # Cache the result with its watermark if fetched successfully
+            if all_issues:
+                self.cache_manager.save_to_cache(
+                    cache_file,
+                    {
+                        "payload": all_issues,
+                        "watermark": _issues_watermark(all_issues),
+                    },
+                )
+            if partial:
+                self.cache_manager.invalidate_cache(partial_file)
+
+            return all_issues
+
+        except Exception as e:
+            handle_generic_exception(
+                e, f"Failed to fetch issues with JQL '{jql_query}'"
+            )
+            return []
+
+    def _is_cache_fresh(self, jql_query, watermark):
+        """
+        Check whether anything matching the JQL changed since the watermark.
+
+        A maxResults=0 probe returns just the match count, so the freshness
+        check costs one tiny request instead of refetching the result set.
+
+        :param jql_query: The original JQL the cache entry was built from.
+        :param watermark: Latest fields.updated timestamp in the cache entry.
+        :return: True when the cached payload is still current.
+        """
+        try:
+            # JQL compares dates as 'yyyy-MM-dd HH:mm'
+            since = watermark[:16].replace("T", " ")
+            probe = self.client.get(
+                "search",
+                params={
+                    "jql": f"({jql_query}) AND updated > '{since}'",
+                    "fields": "key",
+                    "maxResults": 0,
+                },
+                cache=False,
+            )
+            return bool(probe) and probe.get("total", 1) == 0
+        except Exception:
+            return False
+
+    def _fetch_page(self, base_params, start_at, page_size):
+        """Fetch one search page; used by the parallel pagination path."""
+        params = dict(base_params)
+        params["startAt"] = start_at
+        params["maxResults"] = page_size
+        try:
+            return self.client.get("search", params=params, cache=False)
+        except JiraApiError:
+            # The client raises on persistent failures; report the page as
+            # missing so fetch_issues can save the contiguous prefix for a
+            # resumed run instead of unwinding the whole fetch
+            return None
+
+    def _mem_get(self, key, ttl_seconds=3600):
+        """Return an in-memory cached value if present and fresh, else None."""
+        entry = self._mem_cache.get(key)
+        if entry is None or time.time() - entry[0] > ttl_seconds:
+            return None
+        self._mem_cache.move_to_end(key)
+        return entry[1]
+
+    def _mem_put(self, key, value):
+        """Store a value in the in-memory cache, evicting the oldest entry."""
+        self._mem_cache[key] = (time.time(), value)
+        self._mem_cache.move_to_end(key)
+        if len(self._mem_cache) > _MEM_CACHE_MAX:
+            self._mem_cache.popitem(last=False)
+
+    def _get_async_client(self):
+        """Return the shared AsyncJiraClient, creating it on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncJiraClient()
+        return self._async_client
+
+    async def fetch_issues_async(
+        self, jql_query, fields="*", max_results=None, expand_changelog=False
+    ):
+        """
+        Async variant of fetch_issues for concurrent JQL fanout.
+
+        Paginates until exhaustion like the sync path (the server may clamp
+        the page size) and shares the same cache files, so queries answered
+        from cache never touch the network.
+
+        :param jql_query: The JQL query to execute.
+        :param fields: Fields to include in the response.
+        :param max_results: Absolute cap on issues returned; None fetches all.
+        :param expand_changelog: Whether to include changelog data.
+        :return: List of issues.
+        """
+        try:
+            digest = _cache_key(
+                jql_query, _normalize_fields(fields), max_results, expand_changelog
+            )
+            cache_file = f"issues_cache_{digest}.json"
+            cached_entry = self.cache_manager.load_from_cache(
                 cache_file, expiration_minutes=60
             )
-            if cached_data:
+            if cached_entry:
                 logger.info(f"Loaded issues from cache for JQL: {jql_query}")
-                return cached_data
+                # The sync path stores {"payload": ..., "watermark": ...}
+                # wrappers in the same namespace; unwrap them here too
+                if isinstance(cached_entry, dict) and "payload" in cached_entry:
+                    return cached_entry["payload"]
+                return cached_entry
 
-            # Fetch from Jira API if no valid cache is found
             logger.info(f"Fetching issues with JQL: {jql_query}")
-            issues = self.client.get(
-                "search",
-                params={"jql": jql_query, "fields": fields, "maxResults": max_results},
-            )
+            base_params = {"jql": jql_query, "fields": fields}
+            if expand_changelog:
+                base_params["expand"] = "changelog"
+
+            client = self._get_async_client()
+            issues = []
+            start_at = 0
+            page_size = 100
+            while True:
+                page = await client.get(
+                    "search",
+                    params={
+                        **base_params,
+                        "startAt": start_at,
+                        "maxResults": page_size,
+                    },
+                )
+                if not page:
+                    break
+                page_issues = page.get("issues", [])
+                issues.extend(page_issues)
+                start_at += len(page_issues)
+
+                total = page.get("total", 0)
+                if max_results is not None:
+                    total = min(total, max_results)
+                # The server echoes the clamped page size back; follow it
+                effective = page.get("maxResults") or page_size
+                page_size = min(page_size, effective)
+                if not page_issues or start_at >= total:
+                    break
+
+            if max_results is not None:
+                issues = issues[:max_results]
 
-            # Cache the result if fetched successfully
             if issues:
-                self.cache_manager.save_to_cache(cache_file, issues)
+                # Write the same wrapper format the sync path expects, so
+                # either path can serve entries the other produced
+                self.cache_manager.save_to_cache(
+                    cache_file,
+                    {
+                        "payload": issues,
+                        "watermark": _issues_watermark(issues),
+                    },
+                )
 
             return issues
 
@@ -66,6 +692,28 @@ class JiraIssueService:
             )
             return []
 
+    async def fetch_many(self, jql_queries, max_concurrency=8):
+        """
+        Execute several JQL queries concurrently with bounded parallelism.
+
+        Turns an N-serial-request workload (e.g. one query per team) into a
+        bounded-concurrent one; queries answered from cache hold their slot
+        only for the duration of the cache read.
+
+        :param jql_queries: List of JQL queries to execute.
+        :param max_concurrency: Maximum number of in-flight requests.
+        :return: List of results in the same order as `jql_queries`.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _fetch_with_semaphore(jql_query):
+            async with semaphore:
+                return await self.fetch_issues_async(jql_query)
+
+        return await asyncio.gather(
+            *[_fetch_with_semaphore(jql_query) for jql_query in jql_queries]
+        )
+
     def update_issue_fields(self, issue_key, fields):
         """
         Update fields of a Jira issue.
@@ -91,23 +739,15 @@ class JiraIssueService:
         :return: List of completed epics.
         """
         try:
-            cache_file = f"completed_epics_{team_name}_{time_period_days}.json"
-            cached_data = self.cache_manager.load_from_cache(
-                cache_file, expiration_minutes=60
-            )
-            if cached_data:
-                logger.info(
-                    f"Loaded completed epics from cache for team '{team_name}'."
-                )
-                return cached_data
-
-            time_period_ago = datetime.datetime.now() - datetime.timedelta(
-                days=time_period_days
-            )
+            # Quantize the JQL date to a day boundary so every run within
+            # the same day shares one query (and one fetch_issues cache
+            # entry). Caching itself is left to fetch_issues: a second
+            # layer here doubled the disk I/O for the same payload.
+            since = _days_ago(time_period_days)
             jql_query = (
                 f"project = 'Cropwise Core Services' AND type = Epic "
                 f"AND 'Squad[Dropdown]' = '{team_name}' "
-                f"AND statusCategory = Done AND resolved >= {time_period_ago.strftime('%Y-%m-%d')}"
+                f"AND statusCategory = Done AND resolved >= {since}"
             )
             logger.info(
                 (
@@ -115,12 +755,7 @@ class JiraIssueService:
                     f"within the last {time_period_days} days."
                 )
             )
-            epics = self.fetch_issues(jql_query)
-
-            if epics:
-                self.cache_manager.save_to_cache(cache_file, epics)
-
-            return epics
+            return self.fetch_issues(jql_query, fields=_EPIC_FIELDS)
 
         except Exception as e:
             handle_generic_exception(
@@ -128,6 +763,45 @@ class JiraIssueService:
             )
             return []
 
+    def fetch_completed_epics_bulk(self, team_names, time_period_days):
+        """
+        Fetch completed epics for several teams with a single JQL query.
+
+        One 'Squad[Dropdown]' IN (...) query replaces N per-team requests;
+        the result is partitioned back by squad in Python, so the network
+        cost stays constant as the team list grows.
+
+        :param team_names: List of team names to fetch epics for.
+        :param time_period_days: Number of days in the past to search.
+        :return: Dict mapping team name to its list of completed epics.
+        """
+        try:
+            since = _days_ago(time_period_days)
+            quoted_teams = ", ".join(f"'{team}'" for team in team_names)
+            jql_query = (
+                f"project = 'Cropwise Core Services' AND type = Epic "
+                f"AND 'Squad[Dropdown]' in ({quoted_teams}) "
+                f"AND statusCategory = Done AND resolved >= {since}"
+            )
+            logger.info(
+                f"Fetching completed epics for {len(team_names)} teams "
+                f"within the last {time_period_days} days."
+            )
+            epics = self.fetch_issues(jql_query, fields=_EPIC_FIELDS)
+
+            # Bucketing is a cheap in-memory pass, so the underlying
+            # fetch_issues cache is the only persistence layer needed
+            buckets = defaultdict(list)
+            for epic in epics or []:
+                buckets[_issue_squad(epic)].append(epic)
+            return {team: buckets.get(team, []) for team in team_names}
+
+        except Exception as e:
+            handle_generic_exception(
+                e, f"Failed to fetch completed epics for teams {team_names}"
+            )
+            return {}
+
     def fetch_open_issues_by_type(self, team_name, issue_type="Epic", fix_version=None):
         """
         Fetch open issues of a specified type for a team, optionally filtered by fix version.
@@ -138,16 +812,6 @@ class JiraIssueService:
         :return: List of open issues.
         """
         try:
-            cache_file = f"open_issues_{team_name}_{issue_type}_{fix_version}.json"
-            cached_data = self.cache_manager.load_from_cache(
-                cache_file, expiration_minutes=60
-            )
-            if cached_data:
-                logger.info(
-                    f"Loaded open {issue_type}s from cache for team '{team_name}'."
-                )
-                return cached_data
-
             jql_query = (
                 f"project = 'Cropwise Core Services' AND type = '{issue_type}' "
                 f"AND 'Squad[Dropdown]' = '{team_name}' AND statusCategory != Done"
@@ -158,12 +822,9 @@ class JiraIssueService:
             logger.info(
                 f"Fetching open {issue_type}s for team '{team_name}', fix version '{fix_version}'."
             )
-            open_issues = self.fetch_issues(jql_query)
-
-            if open_issues:
-                self.cache_manager.save_to_cache(cache_file, open_issues)
-
-            return open_issues
+            # Caching is left to fetch_issues; keying a second copy here
+            # doubled the disk I/O for the same payload
+            return self.fetch_issues(jql_query, fields=_OPEN_ISSUE_FIELDS)
 
         except Exception as e:
             handle_generic_exception(
@@ -171,6 +832,48 @@ class JiraIssueService:
             )
             return []
 
+    def fetch_open_issues_by_type_bulk(
+        self, team_names, issue_type="Epic", fix_version=None
+    ):
+        """
+        Fetch open issues of a type for several teams with a single query.
+
+        Same N+1 collapse as fetch_completed_epics_bulk: one IN (...) JQL
+        replaces a request per team and results are bucketed by squad.
+
+        :param team_names: List of team names to fetch issues for.
+        :param issue_type: Type of issue to filter (e.g., Epic, Story, Task).
+        :param fix_version: Fix version to filter issues (optional).
+        :return: Dict mapping team name to its list of open issues.
+        """
+        try:
+            quoted_teams = ", ".join(f"'{team}'" for team in team_names)
+            jql_query = (
+                f"project = 'Cropwise Core Services' AND type = '{issue_type}' "
+                f"AND 'Squad[Dropdown]' in ({quoted_teams}) AND statusCategory != Done"
+            )
+            if fix_version:
+                jql_query += f" AND fixVersion = '{fix_version}'"
+
+            logger.info(
+                f"Fetching open {issue_type}s for {len(team_names)} teams, "
+                f"fix version '{fix_version}'."
+            )
+            open_issues = self.fetch_issues(jql_query, fields=_OPEN_ISSUE_FIELDS)
+
+            # Bucketing is a cheap in-memory pass, so the underlying
+            # fetch_issues cache is the only persistence layer needed
+            buckets = defaultdict(list)
+            for issue in open_issues or []:
+                buckets[_issue_squad(issue)].append(issue)
+            return {team: buckets.get(team, []) for team in team_names}
+
+        except Exception as e:
+            handle_generic_exception(
+                e, f"Failed to fetch open issues for teams {team_names}"
+            )
+            return {}
+
     def update_epic_dates(self, issue_key, start_date=None, end_date=None):
         """
         Update the start and end dates for an epic.
@@ -195,6 +898,105 @@ class JiraIssueService:
             )
             return None
 
+    def update_epics_dates(self, updates, max_workers=8):
+        """
+        Update start and end dates for several epics concurrently.
+
+        :param updates: List of (issue_key, start_date, end_date) tuples.
+        :param max_workers: Maximum number of concurrent requests.
+        :return: List of responses from the Jira API.
+        """
+        try:
+            calls = []
+            for issue_key, start_date, end_date in updates:
+                fields = {
+                    "customfield_10015": start_date.isoformat() if start_date else None,
+                    "customfield_10233": end_date.isoformat() if end_date else None,
+                }
+                calls.append((f"issue/{issue_key}", {"fields": fields}))
+
+            logger.info(f"Updating dates for {len(calls)} epics concurrently.")
+            return self.client.put_many(calls, max_workers=max_workers)
+        except Exception as e:
+            handle_generic_exception(e, "Failed to update dates for epics in batch")
+            return []
+
+    def fill_missing_dates_for_completed_epics(self, team_name):
+        """
+        Fetch completed epics with missing start or end dates and update them
+        using changelog data.
+
+        The per-epic PUTs are collected and fanned out concurrently through
+        update_epics_dates rather than issued one at a time.
+
+        :param team_name: The name of the team to filter epics.
+        """
+        try:
+            # JQL to find completed epics with missing start or end dates
+            jql_query = (
+                f"project = 'Cropwise Core Services' AND type = Epic AND status = Done "
+                f"AND 'Squad[Dropdown]' = '{team_name}' AND ("
+                f"'Start date' is EMPTY OR 'End date' is EMPTY)"
+            )
+            logger.info(
+                f"Fetching completed epics with missing dates for team '{team_name}'."
+            )
+            epics = self.fetch_issues(
+                jql_query, fields="key,summary", expand_changelog=True
+            )
+
+            if not epics:
+                logger.info("No completed epics with missing dates found.")
+                return
+
+            updates = []
+            for epic in epics:
+                issue_key = epic["key"]
+                changelog = epic.get("changelog", {}).get("histories", [])
+                start_date = None
+                end_date = None
+
+                # Single pass over the histories: each `created` timestamp is
+                # parsed at most once, and the scan stops at the first
+                # history that completes both dates
+                for history in changelog:
+                    created = None
+                    for item in history.get("items", []):
+                        # Find "7 PI Started" creation (start date)
+                        if not start_date and item.get("toString") == "7 PI Started":
+                            created = created or _history_date(history["created"])
+                            start_date = created
+
+                        # Find transition from "7 PI Started" to "Done" (end date)
+                        if (
+                            not end_date
+                            and item.get("fromString") == "7 PI Started"
+                            and item.get("toString") == "Done"
+                        ):
+                            created = created or _history_date(history["created"])
+                            end_date = created
+
+                    # Stop if both dates are found
+                    if start_date and end_date:
+                        break
+
+                if start_date or end_date:
+                    logger.info(
+                        (
+                            f"Updating epic '{issue_key}' with found dates: "
+                            f"Start - {start_date}, End - {end_date}"
+                        )
+                    )
+                    updates.append((issue_key, start_date, end_date))
+
+            if updates:
+                self.update_epics_dates(updates)
+
+        except Exception as e:
+            handle_generic_exception(
+                e, "Failed to fill missing dates for completed epics"
+            )
+
     def get_issuetype_metadata(self, project_key, issue_type_id):
         """
         Fetch metadata for a specific issue type in a project.
@@ -204,7 +1006,13 @@ class JiraIssueService:
         :return: Metadata of the specified issue type.
         """
         try:
-            cache_file = f"issuetype_metadata_{project_key}_{issue_type_id}.json"
+            cache_file = (
+                f"issuetype_metadata_{_cache_key(project_key, issue_type_id)}.json"
+            )
+            mem_data = self._mem_get(cache_file)
+            if mem_data is not None:
+                return mem_data
+
             cached_data = self.cache_manager.load_from_cache(
                 cache_file, expiration_minutes=60
             )
@@ -213,6 +1021,7 @@ class JiraIssueService:
                     f"Loaded metadata from cache for issue type '{issue_type_id}' "
                     f"in project '{project_key}'."
                 )
+                self._mem_put(cache_file, cached_data)
                 return cached_data
 
             endpoint = f"issue/createmeta/{project_key}/issuetypes/{issue_type_id}"
@@ -227,6 +1036,7 @@ class JiraIssueService:
                     f"in project '{project_key}'"
                 )
                 self.cache_manager.save_to_cache(cache_file, response)
+                self._mem_put(cache_file, response)
                 return response
             else:
                 logger.warning(
@@ -250,7 +1060,11 @@ class JiraIssueService:
         :return: List of issue types for the specified project.
         """
         try:
-            cache_file = f"issuetypes_{project_key}.json"
+            cache_file = f"issuetypes_{_cache_key(project_key)}.json"
+            mem_data = self._mem_get(cache_file)
+            if mem_data is not None:
+                return mem_data
+
             cached_data = self.cache_manager.load_from_cache(
                 cache_file, expiration_minutes=60
             )
@@ -258,6 +1072,7 @@ class JiraIssueService:
                 logger.info(
                     f"Loaded issue types from cache for project '{project_key}'."
                 )
+                self._mem_put(cache_file, cached_data)
                 return cached_data
 
             endpoint = f"issue/createmeta/{project_key}/issuetypes"
@@ -267,6 +1082,7 @@ class JiraIssueService:
             if response:
                 logger.info(f"Retrieved issue metadata for project '{project_key}'")
                 self.cache_manager.save_to_cache(cache_file, response)
+                self._mem_put(cache_file, response)
                 return response
             else:
                 logger.warning(f"No metadata found for project '{project_key}'")
@@ -307,16 +1123,46 @@ class JiraIssueService:
             handle_generic_exception(e, "Failed to create a single issue")
             return None
 
-    def create_bulk_issues(self, project_key, issues_data):
+    def create_bulk_issues(self, project_key, issues_data, chunk_size=50, max_workers=8):
         """
-        Create a single Jira issue based on the metadata.
+        Create Jira issues in bulk, splitting oversized payloads into chunks.
+
+        Jira's issue/bulk endpoint caps entries per call (typically 50);
+        payloads above the cap are split into chunks whose POSTs run
+        concurrently, and the per-chunk responses are merged. Rate-limit
+        responses (429) are retried with backoff by the underlying session.
 
         :param project_key: The project key.
-        :param issuetype: The issue type name.
         :param issues_data: A JSON serializable Python object with a list of dictionaries,
                             each representing an issue to be created.
+        :param chunk_size: Maximum issues per bulk call.
+        :param max_workers: Maximum number of concurrent bulk calls.
         """
         try:
+            updates = (
+                issues_data.get("issueUpdates", [])
+                if isinstance(issues_data, dict)
+                else []
+            )
+            if len(updates) > chunk_size:
+                calls = [
+                    ("issue/bulk", {"issueUpdates": updates[i : i + chunk_size]})
+                    for i in range(0, len(updates), chunk_size)
+                ]
+                responses = self.client.post_many(
+                    calls, max_workers=min(max_workers, len(calls))
+                )
+                combined = {"issues": [], "errors": []}
+                for response in responses:
+                    if response:
+                        combined["issues"].extend(response.get("issues", []))
+                        combined["errors"].extend(response.get("errors", []))
+                logger.info(
+                    f"Issues created in project '{project_key}' "
+                    f"across {len(calls)} bulk calls"
+                )
+                return combined
+
             response = self.client.post(
                 "issue/bulk",
                 issues_data,
@@ -337,6 +1183,66 @@ class JiraIssueService:
             )
             return None
 
+    def bulk_create_from_data(
+        self,
+        project_key,
+        issuetype_id,
+        issue_data_list,
+        metadata,
+        chunk_size=50,
+        max_workers=5,
+    ):
+        """
+        Build payloads for many issues and create them in concurrent chunks.
+
+        Jira's issue/bulk endpoint caps entries per call (typically 50), so
+        the payload list is split into chunks and the chunk POSTs run in
+        parallel; per-issue requests become a handful of batched ones.
+
+        :param project_key: The project key where the issues will be created.
+        :param issuetype_id: The ID of the issue type.
+        :param issue_data_list: List of issue-data dictionaries.
+        :param metadata: Issue-type metadata used to build each payload.
+        :param chunk_size: Maximum issues per bulk call.
+        :param max_workers: Maximum number of concurrent bulk calls.
+        :return: Combined dict with 'issues' and 'errors' from all chunks.
+        """
+        try:
+            self.prefetch_projects(
+                issue_data["project_key"]
+                for issue_data in issue_data_list
+                if "project_key" in issue_data
+            )
+            payloads = [
+                self.build_payload_from_metadata(
+                    project_key, issuetype_id, issue_data, metadata
+                )
+                for issue_data in issue_data_list
+            ]
+
+            calls = [
+                ("issue/bulk", {"issueUpdates": payloads[i : i + chunk_size]})
+                for i in range(0, len(payloads), chunk_size)
+            ]
+            logger.info(
+                f"Creating {len(payloads)} issues in {len(calls)} bulk chunks "
+                f"for project '{project_key}'."
+            )
+            responses = self.client.post_many(calls, max_workers=max_workers)
+
+            combined = {"issues": [], "errors": []}
+            for response in responses:
+                if response:
+                    combined["issues"].extend(response.get("issues", []))
+                    combined["errors"].extend(response.get("errors", []))
+            return combined
+
+        except Exception as e:
+            handle_generic_exception(
+                e, f"Failed to bulk-create issues in project '{project_key}'"
+            )
+            return None
+
     def get_project(self, project_key):
         """
         Fetch data for a specific Jira project.
@@ -346,7 +1252,11 @@ class JiraIssueService:
         """
         try:
             # Cache filename based on project key
-            cache_file = f"project_data_{project_key}.json"
+            cache_file = f"project_data_{_cache_key(project_key)}.json"
+            mem_data = self._mem_get(cache_file)
+            if mem_data is not None:
+                return mem_data
+
             cached_data = self.cache_manager.load_from_cache(
                 cache_file, expiration_minutes=60
             )
@@ -355,6 +1265,7 @@ class JiraIssueService:
                 logger.info(
                     f"Loaded project data from cache for project '{project_key}'."
                 )
+                self._mem_put(cache_file, cached_data)
                 return cached_data
 
             # API endpoint to fetch project data
@@ -370,6 +1281,7 @@ class JiraIssueService:
                     f"Successfully fetched project data for project '{project_key}'"
                 )
                 self.cache_manager.save_to_cache(cache_file, project_data)
+                self._mem_put(cache_file, project_data)
                 return project_data
             else:
                 logger.warning(f"No data returned for project '{project_key}'")
@@ -381,6 +1293,51 @@ class JiraIssueService:
             )
             return None
 
+    def prefetch(self, project_key, issuetype_ids=()):
+        """
+        Warm every metadata cache a bulk operation will need, concurrently.
+
+        Project data, the project's issue types, and each issue type's
+        create metadata are fetched in parallel so the serial on-demand
+        lookups during payload building all become in-memory hits.
+
+        :param project_key: The project key to warm caches for.
+        :param issuetype_ids: Issue-type IDs whose metadata to prefetch.
+        """
+        try:
+            executor = self._get_executor()
+            futures = [
+                executor.submit(self.get_project, project_key),
+                executor.submit(self.fetch_issuetypes, project_key),
+            ]
+            futures.extend(
+                executor.submit(
+                    self.get_issuetype_metadata, project_key, issuetype_id
+                )
+                for issuetype_id in issuetype_ids
+            )
+            wait(futures)
+        except Exception as e:
+            handle_generic_exception(
+                e, f"Failed to prefetch metadata for project '{project_key}'"
+            )
+
+    def prefetch_projects(self, project_keys):
+        """
+        Warm the project caches for the given keys with concurrent lookups.
+
+        build_payload_from_metadata resolves the project for every payload
+        it builds; prefetching each unique key once turns N lookups in a
+        bulk create into in-memory hits.
+
+        :param project_keys: Iterable of project keys to prefetch.
+        """
+        try:
+            unique_keys = list(dict.fromkeys(project_keys))
+            list(self._get_executor().map(self.get_project, unique_keys))
+        except Exception as e:
+            handle_generic_exception(e, "Failed to prefetch project data")
+
     def build_payload_from_metadata(
         self, project_key, issuetype_id, issue_data, metadata
     ):
@@ -401,124 +1358,11 @@ class JiraIssueService:
             del issue_data["project_key"]
 
         payload_fields = {}
-        required_fields = {
-            field["key"]: field for field in metadata["fields"] if field["required"]
-        }
-
-        # Define type handling functions
-        def handle_string(field, value):
-            return value
-
-        def handle_adf_string(value):
-            """
-            Converts a string to ADF format.
-            """
-            doc = ADFDoc()  # Inicializa um documento ADF
-            paragraph = ADFParagraph()  # Cria um parágrafo ADF
-            paragraph.add(ADFText(value))  # Adiciona o texto ao parágrafo usando `add`
-            doc.add(paragraph)  # Adiciona o parágrafo ao documento
-            return doc.validate()  # Valida e retorna o documento ADF formatado
-
-        def handle_array(field, value):
-            allowed_values = {}
-            for v in field.get("allowedValues", []):
-                allowed_values[v["name"]] = v["id"]
-
-            if allowed_values:
-                # Validate each item in array
-                invalid_items = [item for item in value if item not in allowed_values]
-                if invalid_items:
-                    raise ValueError(
-                        f"Invalid values '{invalid_items}' for field '{field['key']}'."
-                    )
-                return [{"id": allowed_values[item]} for item in value]
-            return value
-
-        def handle_attachment(field, value):
-            return [{"id": v} for v in value]
-
-        def handle_boolean(field, value):
-            if not isinstance(value, bool):
-                raise ValueError(
-                    f"Expected boolean for '{field['key']}', got {type(value).__name__}."
-                )
-            return value
-
-        def handle_component(field, value):
-            return [{"id": v} for v in value]
-
-        def handle_date(field, value):
-            if not isinstance(value, str) or len(value.split("-")) != 3:
-                raise ValueError(
-                    f"Expected date format 'YYYY-MM-DD' for '{field['key']}'."
-                )
-            return value
-
-        def handle_issuetype(field, value):
-            return {"id": issuetype_id}
-
-        def handle_number(field, value):
-            if not isinstance(value, (int, float)):
-                raise ValueError(
-                    f"Expected number for '{field['key']}', got {type(value).__name__}."
-                )
-            return value
-
-        def handle_option(field, value):
-            allowed_values = {
-                v["value"]: v["id"] for v in field.get("allowedValues", [])
-            }
-            if value not in allowed_values:
-                raise ValueError(f"Invalid value '{value}' for field '{field['key']}'.")
-            return {"id": allowed_values[value]}
-
-        def handle_priority(field, value):
-            allowed_values = {
-                v["name"]: v["id"] for v in field.get("allowedValues", [])
-            }
-            if value not in allowed_values:
-                raise ValueError(
-                    f"Invalid value '{value}' for priority field '{field['key']}'."
-                )
-            return {"id": allowed_values[value]}
-
-        def handle_project(field, value):
-            return {"id": value}
-
-        def handle_user(field, value):
-            return {"accountId": value}
-
-        def handle_version(field, value):
-            return [{"id": v} for v in value]
-
-        def handle_issuelink(field, value):
-            return {"key": value}
-
-        # Map of field types to handler functions
-        field_handlers = {
-            "string": handle_string,
-            "array": handle_array,
-            "attachment": handle_attachment,
-            "boolean": handle_boolean,
-            "component": handle_component,
-            "date": handle_date,
-            "datetime": handle_date,
-            "issuetype": handle_issuetype,
-            "number": handle_number,
-            "option": handle_option,
-            "priority": handle_priority,
-            "project": handle_project,
-            "user": handle_user,
-            "version": handle_version,
-            "issuelink": handle_issuelink,
-            "parent": handle_issuelink,
-        }
+        index = _index_metadata(metadata)
 
         # Process each field in `issue_data`
         for field_key, field_value in issue_data.items():
-            field_metadata = next(
-                (f for f in metadata["fields"] if f["key"] == field_key), None
-            )
+            field_metadata = index.fields_by_key.get(field_key)
 
             if not field_metadata:
                 raise ValueError(
@@ -530,11 +1374,17 @@ class JiraIssueService:
 
             # Specific handling for ADF fields
             if field_key in ["description", "environment"] and field_type == "string":
-                payload_fields[field_id] = handle_adf_string(field_value)
+                payload_fields[field_id] = _handle_adf_string(field_value)
+            elif field_type == "issuetype":
+                payload_fields[field_id] = {"id": issuetype_id}
             else:
-                handler = field_handlers.get(field_type)
+                handler = _FIELD_HANDLERS.get(field_type)
                 if handler:
-                    payload_fields[field_id] = handler(field_metadata, field_value)
+                    payload_fields[field_id] = handler(
+                        field_metadata,
+                        field_value,
+                        index.allowed_index.get(field_key, {}),
+                    )
                 else:
                     raise ValueError(
                         f"No handler for field type '{field_type}' on field '{field_key}'."
@@ -543,8 +1393,8 @@ class JiraIssueService:
         # Ensure all required fields are provided or have default values
         missing_fields = [
             key
-            for key, field in required_fields.items()
-            if key not in issue_data and not field.get("hasDefaultValue", False)
+            for key in index.required_keys
+            if key not in issue_data and key not in index.defaulted_keys
         ]
         if missing_fields:
             raise ValueError(
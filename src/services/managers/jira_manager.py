@@ -1,13 +1,11 @@
-import datetime
+import functools
 import logging
 
 from src.services.jira_issue_service import JiraIssueService
 from src.utils.error_handler import handle_generic_exception
 from src.utils.json_handler import JSONHandler
-from src.utils.logging_config import configure_logging
 
-# Configure logging
-configure_logging()
+# Logging is configured once at the application entry point
 logger = logging.getLogger(__name__)
 
 
@@ -16,77 +14,19 @@ class JiraManager:
     def __init__(self):
         self.json_handler = JSONHandler()
         self.jira_issue_service = JiraIssueService()
-        self.metadata_cache = {}
+        # Bounded memoization of issue-type metadata lookups; replaces the
+        # hand-rolled self.metadata_cache dict and adds LRU eviction
+        self._get_metadata = functools.lru_cache(maxsize=128)(
+            self.jira_issue_service.get_issuetype_metadata
+        )
 
     def fill_missing_dates_for_completed_epics(self, team_name):
         """
         Fetch completed epics with missing start or end dates and update them using changelog data.
 
         :param team_name: The name of the team to filter epics.
-        :param time_period_days: Number of days in the past to search.
         """
-        try:
-            # JQL to find completed epics with missing start or end dates
-            jql_query = (
-                f"project = 'Cropwise Core Services' AND type = Epic AND status = Done "
-                f"AND 'Squad[Dropdown]' = '{team_name}' AND ("
-                f"'Start date' is EMPTY OR 'End date' is EMPTY)"
-            )
-            logger.info(
-                f"Fetching completed epics with missing dates for team '{team_name}'."
-            )
-            epics = self.fetch_issues(
-                jql_query, fields="key,summary,changelog", expand_changelog=True
-            )
-
-            if not epics:
-                logger.info("No completed epics with missing dates found.")
-                return
-
-            for epic in epics:
-                issue_key = epic["key"]
-                changelog = epic.get("changelog", {}).get("histories", [])
-                start_date = None
-                end_date = None
-
-                # Iterate over changelog histories to find appropriate dates
-                for history in changelog:
-                    for item in history.get("items", []):
-                        # Find "7 PI Started" creation (start date)
-                        if item.get("toString") == "7 PI Started" and not start_date:
-                            start_date = datetime.datetime.strptime(
-                                history["created"], "%Y-%m-%dT%H:%M:%S.%f%z"
-                            ).date()
-
-                        # Find transition from "7 PI Started" to "Done" (end date)
-                        if (
-                            item.get("fromString") == "7 PI Started"
-                            and item.get("toString") == "Done"
-                            and not end_date
-                        ):
-                            end_date = datetime.datetime.strptime(
-                                history["created"], "%Y-%m-%dT%H:%M:%S.%f%z"
-                            ).date()
-
-                        # Stop if both dates are found
-                        if start_date and end_date:
-                            break
-
-                if start_date or end_date:
-                    logger.info(
-                        (
-                            f"Updating epic '{issue_key}' with found dates: "
-                            f"Start - {start_date}, End - {end_date}"
-                        )
-                    )
-                    self.update_epic_dates(
-                        issue_key, start_date=start_date, end_date=end_date
-                    )
-
-        except Exception as e:
-            handle_generic_exception(
-                e, "Failed to fill missing dates for completed epics"
-            )
+        return self.jira_issue_service.fill_missing_dates_for_completed_epics(team_name)
 
     def create_issue(self, json_filename: str):
         """
@@ -175,6 +115,9 @@ class JiraManager:
             if not issue_types:
                 raise ValueError(f"No issue types found for project '{project_key}'")
 
+            # One O(M) pass instead of a linear scan per issue
+            name_to_id = {it["name"]: it["id"] for it in issue_types}
+
             payload = []
             for issue_data in issues_list:
                 transformed_issue = {
@@ -190,36 +133,19 @@ class JiraManager:
                 issuetype_name = transformed_issue.get("issuetype")
 
                 # Find the ID for the sub-task issue type
-                issuetype_id = next(
-                    (
-                        it["id"]
-                        for it in issue_types
-                        if it.get("name") == issuetype_name
-                    ),
-                    None,
-                )
+                issuetype_id = name_to_id.get(issuetype_name)
 
                 if not issuetype_id:
                     raise ValueError(
                         f"Issue type '{issuetype_name}' not found for project '{project_key}'"
                     )
 
-                # Check if metadata is already cached
-                cache_key = f"{project_key}_{issuetype_id}"
-                if cache_key in self.metadata_cache:
-                    metadata = self.metadata_cache[cache_key]
-                else:
-                    # Fetch metadata for the issue type
-                    metadata = self.jira_issue_service.get_issuetype_metadata(
-                        project_key, issuetype_id
+                metadata = self._get_metadata(project_key, issuetype_id)
+                if not metadata:
+                    raise ValueError(
+                        f"Metadata for issue type '{issuetype_name}' not found in "
+                        f"project '{project_key}'"
                     )
-                    if not metadata:
-                        raise ValueError(
-                            f"Metadata for issue type '{issuetype_name}' not found in "
-                            f"project '{project_key}'"
-                        )
-                    # Cache the fetched metadata
-                    self.metadata_cache[cache_key] = metadata
 
                 # Build the payload from metadata and add to list
                 payload_content = self.jira_issue_service.build_payload_from_metadata(
@@ -1,13 +1,24 @@
-import json
+import csv
 import logging
 import os
 
-import pandas as pd
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; DataFrames fall back to to_csv
+    pa = None
+
+from src.utils import fast_json
+from src.utils.logging_config import configure_logging
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
+configure_logging()
 logger = logging.getLogger(__name__)
 
+# Arrow's multi-threaded C++ CSV writer beats pandas' pure-Python one on
+# large tables, but has fixed setup cost; below this row count pandas wins.
+_ARROW_CSV_MIN_ROWS = 10_000
+
 
 class ReportGenerator:
     """Service to generate reports from provided data."""
@@ -21,17 +32,22 @@ class ReportGenerator:
         self.output_dir = output_dir
         os.makedirs(self.output_dir, exist_ok=True)
 
-    def generate_json_report(self, data, file_name):
+    def generate_json_report(self, data, file_name, pretty=False):
         """
         Generate a JSON report from the given data.
 
         :param data: Data to be written to the JSON report.
         :param file_name: Name of the JSON file to be created.
+        :param pretty: Indent the output for human reading; machine-consumed
+                       reports default to compact serialization, which is
+                       several times faster to encode and ~30% smaller.
         """
         try:
             file_path = os.path.join(self.output_dir, file_name)
-            with open(file_path, "w") as json_file:
-                json.dump(data, json_file, indent=4)
+            # Bytes out, binary mode, large buffer: one encode pass and few
+            # syscalls even for multi-MB reports
+            with open(file_path, "wb", buffering=1 << 20) as json_file:
+                json_file.write(fast_json.dumps_bytes(data, indent=pretty))
             logger.info(f"JSON report generated successfully at: {file_path}")
         except Exception as e:
             logger.error(f"Failed to generate JSON report {file_name}: {e}")
@@ -46,17 +62,30 @@ class ReportGenerator:
         """
         try:
             file_path = os.path.join(self.output_dir, file_name)
-            if isinstance(data, pd.DataFrame):
-                data.to_csv(file_path, index=False)
-            elif isinstance(data, list) and all(
+            if isinstance(data, list) and all(
                 isinstance(item, dict) for item in data
             ):
-                df = pd.DataFrame(data)
-                df.to_csv(file_path, index=False)
+                # Stream rows straight to disk: building a DataFrame just to
+                # dump it allocates typed columns and an index for nothing
+                fieldnames = list(dict.fromkeys(k for row in data for k in row))
+                with open(file_path, "w", newline="") as csv_file:
+                    writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
+                    writer.writeheader()
+                    writer.writerows(data)
             else:
-                raise ValueError(
-                    "Data must be a list of dictionaries or a pandas DataFrame."
-                )
+                # pandas is only needed (and imported) for DataFrame input
+                import pandas as pd
+
+                if not isinstance(data, pd.DataFrame):
+                    raise ValueError(
+                        "Data must be a list of dictionaries or a pandas DataFrame."
+                    )
+                if pa is not None and len(data) > _ARROW_CSV_MIN_ROWS:
+                    pa_csv.write_csv(
+                        pa.Table.from_pandas(data, preserve_index=False), file_path
+                    )
+                else:
+                    data.to_csv(file_path, index=False)
             logger.info(f"CSV report generated successfully at: {file_path}")
         except ValueError as e:
             logger.error(f"Invalid data format for CSV report {file_name}: {e}")
@@ -1,5 +1,4 @@
-import json
-import os
+from src.utils import fast_json
 
 
 def save_data_to_file(data, filename):
@@ -8,7 +7,7 @@ def save_data_to_file(data, filename):
     """
     try:
         with open(filename, "w") as cache_file:
-            json.dump(data, cache_file)
+            cache_file.write(fast_json.dumps(data))
     except Exception as e:
         raise RuntimeError(f"An unexpected error occurred while saving data: {e}")
 
@@ -18,9 +17,11 @@ def load_data_from_file(filename):
     Load data from a specified file in JSON format.
     """
     try:
-        if os.path.exists(filename):
-            with open(filename, "r") as cache_file:
-                return json.load(cache_file)
+        # EAFP: a missing file surfaces as FileNotFoundError from open(),
+        # saving the extra stat of an exists() pre-check
+        with open(filename, "rb") as cache_file:
+            return fast_json.loads(cache_file.read())
+    except FileNotFoundError:
         return None
     except Exception as e:
         raise RuntimeError(f"An unexpected error occurred while loading data: {e}")
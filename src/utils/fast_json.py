@@ -0,0 +1,48 @@
+"""
+Fast JSON helpers backed by orjson, with a transparent stdlib fallback.
+
+orjson parses and serializes several times faster than the stdlib `json`
+module, which matters for large Jira payloads (changelogs, bulk search
+results). Callers import `loads`/`dumps` from here instead of using
+`json` directly.
+"""
+
+try:
+    import orjson
+
+    def loads(data):
+        """Parse JSON from a `str`, `bytes` or `bytearray`."""
+        return orjson.loads(data)
+
+    def dumps(obj, indent=False):
+        """Serialize an object to a JSON string, optionally indented."""
+        options = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=options).decode()
+
+    def dumps_bytes(obj, indent=False):
+        """Serialize an object straight to JSON bytes, skipping the decode."""
+        options = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=options)
+
+except ImportError:
+    import json as _json
+
+    def loads(data):
+        """Parse JSON from a `str`, `bytes` or `bytearray`."""
+        # The stdlib parser does not accept buffer views, so materialize
+        # them; orjson above parses them zero-copy.
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return _json.loads(data)
+
+    def dumps(obj, indent=False):
+        """Serialize an object to a JSON string, optionally indented."""
+        return _json.dumps(obj, indent=2 if indent else None)
+
+    def dumps_bytes(obj, indent=False):
+        """Serialize an object straight to JSON bytes, skipping the decode."""
+        return dumps(obj, indent=indent).encode("utf-8")
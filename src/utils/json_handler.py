@@ -1,13 +1,11 @@
-import json
 import logging
 import os
 from typing import Any, Optional
 
+from src.utils import fast_json
 from src.utils.error_handler import handle_generic_exception
-from src.utils.logging_config import configure_logging
 
-# Configure logging
-configure_logging()
+# Logging is configured once at the application entry point
 logger = logging.getLogger(__name__)
 
 
@@ -35,61 +33,42 @@ class JSONHandler:
         """Helper to get the full path for a file in the storage directory."""
         return os.path.join(self.storage_dir, filename)
 
-    def _is_valid_json(self, json_string: str) -> bool:
-        """
-        Check if a string contains valid JSON.
-
-        :param json_string: JSON string to validate.
-        :return: True if the string contains valid JSON, False otherwise.
-        """
-        try:
-            json.loads(json_string)
-            logger.info("JSON string is valid.")
-            return True
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON string: {e.msg}")
-            return False
-
     def load_json(self, filename: str) -> Optional[Any]:
         """
-        Load data from a specified JSON file with validation.
+        Load data from a specified JSON file.
 
         :param filename: The name of the JSON file to load data from.
         :return: Parsed JSON data if available and valid, otherwise None.
         """
         file_path = self._get_file_path(filename)
-        if not os.path.exists(file_path):
-            logger.info(f"File '{filename}' does not exist.")
-            return None
-
         try:
-            with open(file_path, "r") as file:
-                json_string = file.read()
-                # Validate JSON string before parsing
-                if not self._is_valid_json(json_string):
-                    logger.warning(f"The file '{filename}' contains invalid JSON.")
-                    return None
-                data = json.loads(json_string)
-                logger.info(f"Loaded JSON data from '{filename}'.")
-                return data
+            # A single parse validates as it goes: the former pre-validation
+            # pass decoded the whole document a second time just to throw
+            # the result away. Opening directly also drops the exists()
+            # pre-check, so a miss costs one syscall instead of two
+            with open(file_path, "rb") as file:
+                data = fast_json.loads(file.read())
+            logger.info(f"Loaded JSON data from '{filename}'.")
+            return data
+        except FileNotFoundError:
+            logger.info(f"File '{filename}' does not exist.")
+        except ValueError as e:
+            logger.error(f"The file '{filename}' contains invalid JSON: {e}")
         except Exception as e:
             handle_generic_exception(e, f"Unexpected error while loading '{filename}'")
         return None
 
     def save_json(self, filename: str, data: Any) -> None:
         """
-        Save data to a specified JSON file with validation.
+        Save data to a specified JSON file.
 
         :param filename: The name of the JSON file to save data to.
         :param data: The data to be saved, must be JSON-serializable.
         """
         try:
-            # Convert data to JSON string for validation
-            json_string = json.dumps(data)
-            if not self._is_valid_json(json_string):
-                logger.error("Data provided is not a valid JSON format.")
-                raise ValueError("Data provided is not a valid JSON format.")
-
+            # Serialization itself raises on non-serializable input, so one
+            # dumps call both validates and produces the output
+            json_string = fast_json.dumps(data)
             file_path = self._get_file_path(filename)
             with open(file_path, "w") as file:
                 file.write(json_string)
@@ -11,14 +11,24 @@ LOG_FILE_PATH = os.path.join(LOG_DIR, "application.log")
 # Configuração de tempo para limpar logs antigos (em horas)
 LOG_RETENTION_HOURS = 1  # Este valor pode ser ajustado conforme necessário
 
+# Memoized flag so repeated configure_logging() calls (one per importing
+# module) are no-ops even if another library already attached handlers to
+# the root logger.
+_CONFIGURED = False
+
 
 def configure_logging():
     """Configure logging for the entire application."""
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+
     # Create a logger
     logger = logging.getLogger()
 
     # Check if the logger already has handlers to avoid duplication
     if logger.hasHandlers():
+        _CONFIGURED = True
         return
 
     logger.setLevel(logging.INFO)
@@ -43,6 +53,7 @@ def configure_logging():
     logger.addHandler(console_handler)
 
     logger.info("Logging configuration completed.")
+    _CONFIGURED = True
 
     # Perform log cleanup
     cleanup_old_logs()